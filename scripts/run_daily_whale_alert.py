@@ -110,7 +110,7 @@ def check_paper_inactive(paper_days: int):
         FROM whales w
         WHERE w.copy_status = 'paper'
           AND (w.last_active_at IS NULL 
-               OR w.last_active_at < NOW() - INTERVAL '%s days')
+               OR w.last_active_at < NOW() - make_interval(days => %s))
         ORDER BY w.last_active_at NULLS FIRST
         LIMIT 20
     """
@@ -128,7 +128,7 @@ def check_tracked_inactive(tracked_days: int):
         FROM whales w
         WHERE w.copy_status = 'tracked'
           AND (w.last_active_at IS NULL 
-               OR w.last_active_at < NOW() - INTERVAL '%s days')
+               OR w.last_active_at < NOW() - make_interval(days => %s))
         ORDER BY w.last_active_at NULLS FIRST
         LIMIT 20
     """
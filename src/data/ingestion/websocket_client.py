@@ -15,6 +15,14 @@ import structlog
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json decoding
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 logger = structlog.get_logger(__name__)
 
 
@@ -35,11 +43,14 @@ class PolymarketWebSocket:
         api_secret: Optional[str] = None,
         api_passphrase: Optional[str] = None,
         on_message: Optional[Callable[[WebSocketMessage], Any]] = None,
+        compression: Optional[str] = "deflate",
     ):
         self.api_key = api_key
         self.api_secret = api_secret
         self.api_passphrase = api_passphrase
         self.on_message = on_message
+        # Passed to websockets.connect; None skips permessage-deflate negotiation
+        self.compression = compression
 
         self._ws = None
         self._running = False
@@ -56,7 +67,8 @@ class PolymarketWebSocket:
         for attempt in range(retries):
             try:
                 self._ws = await asyncio.wait_for(
-                    websockets.connect(self.WS_URL), timeout=15.0
+                    websockets.connect(self.WS_URL, compression=self.compression),
+                    timeout=15.0,
                 )
                 self._connected = True
                 logger.info("websocket_connected", url=self.WS_URL)
@@ -167,7 +179,7 @@ class PolymarketWebSocket:
                             pass
 
                     try:
-                        data = json.loads(raw_message)
+                        data = _json_loads(raw_message)
                         logger.debug(
                             "ws_received",
                             data_type=type(data).__name__,
@@ -7,15 +7,17 @@ WhaleTradesRepo — единая точка записи в таблицу whale
 - Автоматический lookup whale_id из таблицы whales
 - Счётчики saved/rejected/duplicates
 """
+import csv
+import io
 import re
 from collections import deque
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import structlog
 from sqlalchemy import text
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import DBAPIError, DisconnectionError, OperationalError, SQLAlchemyError
 
 logger = structlog.get_logger(__name__)
 
@@ -46,6 +48,34 @@ _INSERT_ON_CONFLICT = """
     ON CONFLICT (tx_hash) WHERE tx_hash IS NOT NULL AND tx_hash <> '' DO NOTHING
 """
 
+# Скомпилированные один раз text()-конструкции — не парсим SQL на каждый вызов
+_INSERT_PLAIN_STMT = text(_INSERT_PLAIN)
+_INSERT_ON_CONFLICT_STMT = text(_INSERT_ON_CONFLICT)
+_SELECT_TX_HASH_STMT = text("SELECT 1 FROM whale_trades WHERE tx_hash = :tx_hash")
+_SELECT_TX_HASHES_STMT = text("SELECT tx_hash FROM whale_trades WHERE tx_hash = ANY(:tx_hashes)")
+_SELECT_WHALE_ID_STMT = text("SELECT id FROM whales WHERE wallet_address = :wallet")
+_SELECT_WHALE_IDS_STMT = text("SELECT wallet_address, id FROM whales WHERE wallet_address = ANY(:wallets)")
+
+# Пакеты строк без tx_hash больше порога пишем через COPY (psycopg2 и psycopg 3)
+_COPY_MIN_ROWS = 200
+_COPY_COLUMNS = (
+    "whale_id", "wallet_address", "market_id", "market_title", "side",
+    "size_usd", "price", "outcome", "market_category", "traded_at", "tx_hash", "source", "token_id",
+)
+_COPY_SQL = (
+    f"COPY whale_trades ({', '.join(_COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+)
+# psycopg 3 сам сериализует строки (write_row) — обычный текстовый формат
+_COPY_ROWS_SQL = f"COPY whale_trades ({', '.join(_COPY_COLUMNS)}) FROM STDIN"
+
+
+def is_connection_error(error: Exception) -> bool:
+    """True, если запись упала из-за соединения с БД (строки можно повторить позже)."""
+    if isinstance(error, (OperationalError, DisconnectionError)):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
 
 class WhaleTradesRepo:
     """
@@ -67,6 +97,8 @@ class WhaleTradesRepo:
         self._burst_min_size_usd: Decimal = Decimal("50")
         self._burst_counters: dict[str, deque] = {}
         self._burst_blocked_count: int = 0
+        # wallet_address -> whales.id; id кита не меняется, кэшируем только найденные
+        self._whale_id_cache: Dict[str, int] = {}
     
     def _check_burst(self, wallet_address: str, market_id: str, size_usd: Decimal, now: datetime) -> bool:
         if size_usd >= self._burst_min_size_usd:
@@ -102,6 +134,266 @@ class WhaleTradesRepo:
         Returns:
             "saved" | "rejected" | "duplicate" | "burst_blocked"
         """
+        status, params = self._prepare_trade(
+            wallet_address=wallet_address,
+            market_id=market_id,
+            side=side,
+            size_usd=size_usd,
+            price=price,
+            outcome=outcome,
+            market_title=market_title,
+            market_category=market_category,
+            tx_hash=tx_hash,
+            source=source,
+            traded_at=traded_at,
+            token_id=token_id,
+        )
+        if params is None:
+            return status
+
+        wallet_address = params["wallet_address"]
+        tx_hash_val = params["tx_hash"]
+
+        # Lookup whale_id из таблицы whales
+        params["whale_id"] = self._lookup_whale_id(wallet_address)
+        
+        # === ЗАПИСЬ ===
+        
+        try:
+            session = self._session_factory()
+            try:
+                # Дедупликация: проверка tx_hash перед INSERT
+                if tx_hash_val:
+                    existing = session.execute(
+                        _SELECT_TX_HASH_STMT,
+                        {"tx_hash": tx_hash_val}
+                    ).fetchone()
+                    if existing:
+                        self._stats["duplicates"] += 1
+                        logger.debug(
+                            "trade_duplicate",
+                            tx_hash=tx_hash,
+                            wallet=wallet_address,
+                            market_id=market_id,
+                        )
+                        return "duplicate"
+                
+                # Выбор SQL в зависимости от наличия tx_hash
+                stmt = _INSERT_ON_CONFLICT_STMT if tx_hash_val else _INSERT_PLAIN_STMT
+                session.execute(stmt, params)
+                session.commit()
+                self._stats["saved"] += 1
+                logger.debug(
+                    "trade_saved",
+                    wallet=wallet_address,
+                    market_id=market_id,
+                    side=params["side"],
+                    size_usd=str(size_usd),
+                    tx_hash=tx_hash,
+                )
+                return "saved"
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.error(
+                    "trade_save_error",
+                    error=str(e),
+                    wallet=wallet_address,
+                    market_id=market_id,
+                )
+                raise
+            finally:
+                session.close()
+        except SQLAlchemyError:
+            raise
+        except Exception as e:
+            logger.error(
+                "trade_save_unexpected_error",
+                error=str(e),
+                wallet=wallet_address,
+                market_id=market_id,
+            )
+            raise
+
+    def save_trades(self, trades: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Пакетная запись в whale_trades: те же проверки, что и в save_trade,
+        но один lookup whale_id, одна проверка tx_hash и один executemany
+        INSERT на весь пакет в одной транзакции.
+        
+        Args:
+            trades: Список kwargs для save_trade.
+        
+        Returns:
+            Счётчики по статусам: saved / rejected / duplicate / burst_blocked / failed.
+        """
+        counts, prepared = self.prepare_trades(trades)
+        counts.update(self.save_prepared_trades(prepared))
+        return counts
+
+    def prepare_trades(
+        self, trades: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+        """
+        Валидация пакета без обращения к БД (счётчики и burst учитываются здесь).
+        
+        Args:
+            trades: Список kwargs для save_trade.
+        
+        Returns:
+            (счётчики rejected / burst_blocked, параметры INSERT для save_prepared_trades)
+        """
+        counts = {"saved": 0, "rejected": 0, "duplicate": 0, "burst_blocked": 0, "failed": 0}
+        prepared: List[Dict[str, Any]] = []
+        for trade in trades:
+            status, params = self._prepare_trade(**trade)
+            if params is None:
+                counts[status] += 1
+            else:
+                prepared.append(params)
+        return counts, prepared
+
+    def save_prepared_trades(self, prepared: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Запись строк из prepare_trades одной транзакцией.
+        
+        Если пакет отклонён из-за данных, строки пишутся по одной, чтобы одна
+        плохая строка не теряла остальные. Ошибки соединения пробрасываются:
+        те же строки можно передать сюда повторно, не проходя валидацию заново.
+        
+        Returns:
+            Счётчики saved / duplicate / failed.
+        """
+        counts = {"saved": 0, "duplicate": 0, "failed": 0}
+        if not prepared:
+            return counts
+
+        whale_ids = self._lookup_whale_ids({p["wallet_address"] for p in prepared})
+
+        session = self._session_factory()
+        try:
+            tx_hashes = [p["tx_hash"] for p in prepared if p["tx_hash"]]
+            seen = set()
+            if tx_hashes:
+                seen = {
+                    row[0]
+                    for row in session.execute(
+                        _SELECT_TX_HASHES_STMT,
+                        {"tx_hashes": tx_hashes},
+                    )
+                }
+
+            plain: List[Dict[str, Any]] = []
+            with_hash: List[Dict[str, Any]] = []
+            for params in prepared:
+                tx_hash_val = params["tx_hash"]
+                if tx_hash_val:
+                    if tx_hash_val in seen:
+                        counts["duplicate"] += 1
+                        continue
+                    seen.add(tx_hash_val)
+                params["whale_id"] = whale_ids.get(params["wallet_address"])
+                (with_hash if tx_hash_val else plain).append(params)
+
+            copied = len(plain) > _COPY_MIN_ROWS and self._copy_rows(session, plain)
+            if plain and not copied:
+                session.execute(_INSERT_PLAIN_STMT, plain)
+            if with_hash:
+                session.execute(_INSERT_ON_CONFLICT_STMT, with_hash)
+            session.commit()
+            counts["saved"] = len(plain) + len(with_hash)
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error("trade_batch_save_error", error=str(e), batch_size=len(prepared))
+            if is_connection_error(e):
+                raise
+            counts["saved"] = self._insert_rows_individually(plain + with_hash)
+            counts["failed"] = len(plain) + len(with_hash) - counts["saved"]
+        finally:
+            session.close()
+
+        self._stats["saved"] += counts["saved"]
+        self._stats["duplicates"] += counts["duplicate"]
+        logger.debug("trade_batch_saved", **counts)
+        return counts
+
+    def _insert_rows_individually(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Построчная запись после отказа пакета: каждая строка в своей транзакции.
+        
+        Returns:
+            Количество записанных строк.
+        """
+        saved = 0
+        for params in rows:
+            stmt = _INSERT_ON_CONFLICT_STMT if params["tx_hash"] else _INSERT_PLAIN_STMT
+            session = self._session_factory()
+            try:
+                session.execute(stmt, params)
+                session.commit()
+                saved += 1
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.error(
+                    "trade_save_error",
+                    error=str(e),
+                    wallet=params["wallet_address"],
+                    market_id=params["market_id"],
+                )
+            finally:
+                session.close()
+        return saved
+
+    @staticmethod
+    def _copy_rows(session, rows: List[Dict[str, Any]]) -> bool:
+        """
+        COPY строк без tx_hash в текущей транзакции сессии.
+        
+        Returns:
+            False, если драйвер не умеет COPY (ни psycopg2, ни psycopg 3) — тогда executemany.
+        """
+        cursor = session.connection().connection.dbapi_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):
+                # psycopg2
+                buf = io.StringIO()
+                writer = csv.writer(buf)
+                for row in rows:
+                    writer.writerow(["\\N" if row[c] is None else row[c] for c in _COPY_COLUMNS])
+                buf.seek(0)
+                cursor.copy_expert(_COPY_SQL, buf)
+                return True
+            if hasattr(cursor, "copy"):
+                # psycopg 3
+                with cursor.copy(_COPY_ROWS_SQL) as copy:
+                    for row in rows:
+                        copy.write_row([row[c] for c in _COPY_COLUMNS])
+                return True
+            return False
+        finally:
+            cursor.close()
+
+    def _prepare_trade(
+        self,
+        wallet_address: str,
+        market_id: str,
+        side: str,
+        size_usd: Decimal,
+        price: Decimal,
+        outcome: Optional[str] = None,
+        market_title: Optional[str] = None,
+        market_category: Optional[str] = None,
+        tx_hash: Optional[str] = None,
+        source: str = "BACKFILL",
+        traded_at: Optional[datetime] = None,
+        token_id: Optional[str] = None,
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Валидация и нормализация одной сделки (без обращения к БД).
+        
+        Returns:
+            ("ok", параметры INSERT без whale_id) либо
+            ("rejected" | "burst_blocked", None).
+        """
         # === ВАЛИДАЦИЯ ===
         
         # 1. side IN ('buy', 'sell')
@@ -115,7 +407,7 @@ class WhaleTradesRepo:
                 market_id=market_id,
                 side=side,
             )
-            return "rejected"
+            return "rejected", None
         
         # 2. size_usd > 0
         if size_usd <= 0:
@@ -127,7 +419,7 @@ class WhaleTradesRepo:
                 market_id=market_id,
                 size_usd=str(size_usd),
             )
-            return "rejected"
+            return "rejected", None
         
         # 3. price > 0
         if price <= 0:
@@ -139,7 +431,7 @@ class WhaleTradesRepo:
                 market_id=market_id,
                 price=str(price),
             )
-            return "rejected"
+            return "rejected", None
         
         # 3b. market_id формат (TRD-451): 0x + 64 hex. Отсекает комбо-рынки
         # (усечённый conditionId) и пустой conditionId — идентичность невосстановима.
@@ -152,7 +444,7 @@ class WhaleTradesRepo:
                 market_id=market_id,
                 market_id_len=len(market_id) if market_id else 0,
             )
-            return "rejected"
+            return "rejected", None
 
         # 4. Burst detection (только для свежих сделок < 2 часов)
         trade_time = traded_at if traded_at is not None else datetime.utcnow()
@@ -166,7 +458,7 @@ class WhaleTradesRepo:
                 size_usd=str(size_usd),
                 burst_blocked_total=self._burst_blocked_count,
             )
-            return "burst_blocked"
+            return "burst_blocked", None
         
         # 5. market_category — если None/empty, установить 'unknown'
         if not market_category or not market_category.strip():
@@ -198,101 +490,73 @@ class WhaleTradesRepo:
         if traded_at is None:
             traded_at = datetime.utcnow()
         
-        # Lookup whale_id из таблицы whales
-        whale_id = self._lookup_whale_id(wallet_address)
-        
-        # === ЗАПИСЬ ===
-        
+        tx_hash_val = tx_hash.strip() if tx_hash and tx_hash.strip() else None
+        return "ok", {
+            "whale_id": None,
+            "wallet_address": wallet_address,
+            "market_id": market_id,
+            "market_title": market_title,
+            "side": side_normalized,
+            "size_usd": size_usd,
+            "price": price,
+            "outcome": outcome,
+            "market_category": market_category,
+            "traded_at": traded_at,
+            "tx_hash": tx_hash_val,
+            "source": source,
+            "token_id": token_id,
+        }
+    
+    def _lookup_whale_id(self, wallet_address: str) -> Optional[int]:
+        """Lookup whale_id из таблицы whales по wallet_address."""
+        wallet = wallet_address.lower().strip()
+        whale_id = self._whale_id_cache.get(wallet)
+        if whale_id is not None:
+            return whale_id
         try:
             session = self._session_factory()
             try:
-                # Дедупликация: проверка tx_hash перед INSERT
-                if tx_hash and tx_hash.strip():
-                    existing = session.execute(
-                        text("SELECT 1 FROM whale_trades WHERE tx_hash = :tx_hash"),
-                        {"tx_hash": tx_hash.strip()}
-                    ).fetchone()
-                    if existing:
-                        self._stats["duplicates"] += 1
-                        logger.debug(
-                            "trade_duplicate",
-                            tx_hash=tx_hash,
-                            wallet=wallet_address,
-                            market_id=market_id,
-                        )
-                        return "duplicate"
-                
-                # Выбор SQL в зависимости от наличия tx_hash
-                tx_hash_val = tx_hash.strip() if tx_hash and tx_hash.strip() else None
-                sql = _INSERT_ON_CONFLICT if tx_hash_val else _INSERT_PLAIN
-                session.execute(
-                    text(sql),
-                    {
-                        "whale_id": whale_id,
-                        "wallet_address": wallet_address,
-                        "market_id": market_id,
-                        "market_title": market_title,
-                        "side": side_normalized,
-                        "size_usd": size_usd,
-                        "price": price,
-                        "outcome": outcome,
-                        "market_category": market_category,
-                        "traded_at": traded_at,
-                        "tx_hash": tx_hash_val,
-                        "source": source,
-                        "token_id": token_id,
-                    }
-                )
-                session.commit()
-                self._stats["saved"] += 1
-                logger.debug(
-                    "trade_saved",
-                    wallet=wallet_address,
-                    market_id=market_id,
-                    side=side_normalized,
-                    size_usd=str(size_usd),
-                    tx_hash=tx_hash,
-                )
-                return "saved"
-            except SQLAlchemyError as e:
-                session.rollback()
-                logger.error(
-                    "trade_save_error",
-                    error=str(e),
-                    wallet=wallet_address,
-                    market_id=market_id,
-                )
-                raise
+                result = session.execute(
+                    _SELECT_WHALE_ID_STMT,
+                    {"wallet": wallet}
+                ).fetchone()
+                if not result:
+                    return None
+                self._whale_id_cache[wallet] = result[0]
+                return result[0]
             finally:
                 session.close()
         except SQLAlchemyError:
-            raise
-        except Exception as e:
-            logger.error(
-                "trade_save_unexpected_error",
-                error=str(e),
-                wallet=wallet_address,
-                market_id=market_id,
-            )
-            raise
+            # Таблица whales может не существовать или быть недоступна
+            return None
+        except Exception:
+            return None
     
-    def _lookup_whale_id(self, wallet_address: str) -> Optional[int]:
-        """Lookup whale_id из таблицы whales по wallet_address."""
+    def _lookup_whale_ids(self, wallet_addresses: Set[str]) -> Dict[str, int]:
+        """Lookup whale_id для набора адресов одним запросом (с кэшем)."""
+        cache = self._whale_id_cache
+        found = {w: cache[w] for w in wallet_addresses if w in cache}
+        missing = [w for w in wallet_addresses if w not in found]
+        if not missing:
+            return found
         try:
             session = self._session_factory()
             try:
                 result = session.execute(
-                    text("SELECT id FROM whales WHERE wallet_address = :wallet"),
-                    {"wallet": wallet_address.lower().strip()}
-                ).fetchone()
-                return result[0] if result else None
+                    _SELECT_WHALE_IDS_STMT,
+                    {"wallets": missing}
+                )
+                fetched = {row[0]: row[1] for row in result}
             finally:
                 session.close()
         except SQLAlchemyError:
             # Таблица whales может не существовать или быть недоступна
-            return None
+            return found
         except Exception:
-            return None
+            return found
+        cache.update(fetched)
+        found.update(fetched)
+        return found
     
     def get_stats(self) -> dict:
         """Вернуть копию текущих счётчиков."""
@@ -4,14 +4,16 @@
 import asyncio
 import argparse
 import os
+import signal
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from typing import Optional, Set
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from src.monitoring import get_logger
+from src.monitoring.metrics import probe_event_loop_lag
 from src.monitoring.notification_worker import NotificationWorker
 from src.research.whale_tracker import WhaleTracker
 
@@ -127,11 +129,22 @@ def _get_pending_paper_trades(database_url: str, limit: int = 10) -> list:
     pass
 
 
+def _decimal_arg(value: str) -> Decimal:
+    """argparse type for Decimal options; bad input becomes a usage error."""
+    try:
+        parsed = Decimal(value)
+    except InvalidOperation:
+        raise argparse.ArgumentTypeError(f"invalid decimal value: {value!r}")
+    if not parsed.is_finite():
+        raise argparse.ArgumentTypeError(f"invalid decimal value: {value!r}")
+    return parsed
+
+
 async def main():
     """Main trading loop with whale copy trading."""
     parser = argparse.ArgumentParser(description="Polymarket Trading Bot")
     parser.add_argument("--mode", choices=["paper", "live"], default="paper")
-    parser.add_argument("--bankroll", type=float, default=100.0, help="DEPRECATED: Use INITIAL_BANKROLL env var instead")
+    parser.add_argument("--bankroll", type=_decimal_arg, default=Decimal("100.0"), help="DEPRECATED: Use INITIAL_BANKROLL env var instead")
     parser.add_argument("--observation-mode", action="store_true", default=False)
     args = parser.parse_args()
 
@@ -188,15 +201,33 @@ async def main():
     # roundtrip_interval = 900  # Run whale roundtrip reconstruction every 900 iterations (15 minutes)
     # roundtrip_settle_interval = 300  # Run roundtrip settlement every 300 iterations (5 minutes)
 
+    # One shared handler for SIGINT/SIGTERM so `docker stop` and Ctrl-C both
+    # reach the shutdown path below
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+
+    def _request_stop(*_: object) -> None:
+        loop.call_soon_threadsafe(stop_event.set)
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows: the loop has no signal handler support
+            signal.signal(sig, _request_stop)
+
+    notification_task = None
+    lag_probe_task = None
     try:
         # Start notification worker as background task (skip in observation mode)
-        notification_task = None
         if notification_worker:
             notification_task = asyncio.create_task(notification_worker.start())
             logger.info("notification_worker_started")
 
+        lag_probe_task = asyncio.create_task(probe_event_loop_lag())
+
         _heartbeat_logged = False
-        while True:
+        while not stop_event.is_set():
             if not _heartbeat_logged:
                 logger.info("Phase 2B: heartbeat-only mode (paper_trades via DB trigger, roundtrips via roundtrip_builder)")
                 _heartbeat_logged = True
@@ -212,13 +243,22 @@ async def main():
             except Exception:
                 pass  # Non-critical, don't fail the loop
 
-    except KeyboardInterrupt:
+    finally:
         logger.info("Shutting down...")
         if notification_worker:
             notification_worker.stop()
         if notification_task:
             notification_task.cancel()
+        if lag_probe_task:
+            lag_probe_task.cancel()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop is a soft dependency (Linux/macOS): faster loop when available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(main())
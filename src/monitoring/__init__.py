@@ -2,6 +2,15 @@
 """Monitoring and logging package."""
 
 from .logger import get_logger
-from .telegram_alerts import TelegramAlerts
 
 __all__ = ["get_logger", "TelegramAlerts"]
+
+
+def __getattr__(name):
+    # Deferred so `from src.monitoring import get_logger` does not pull in
+    # aiohttp and the Telegram client
+    if name == "TelegramAlerts":
+        from .telegram_alerts import TelegramAlerts
+
+        return TelegramAlerts
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,15 @@ import sys
 import os
 from pathlib import Path
 
+# Resolved once at import
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_DIR = Path(os.getenv("LOG_DIR", Path(__file__).parent.parent.parent / "logs"))
+
 
 def get_logger(name: str):
     """Get structured logger instance."""
-    log_dir = Path(__file__).parent.parent.parent / "logs"
-    log_dir.mkdir(exist_ok=True)
+    log_dir = LOG_DIR
+    log_dir.mkdir(parents=True, exist_ok=True)
 
     structlog.configure(
         processors=[
@@ -38,10 +42,10 @@ def get_logger(name: str):
 
 def configure_logging():
     """Configure logging with both stdout and file output."""
-    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+    log_level = LOG_LEVEL
 
-    log_dir = Path(__file__).parent.parent.parent / "logs"
-    log_dir.mkdir(exist_ok=True)
+    log_dir = LOG_DIR
+    log_dir.mkdir(parents=True, exist_ok=True)
 
     log_file = log_dir / "bot.log"
 
@@ -1,31 +1,44 @@
 # -*- coding: utf-8 -*-
 """Metrics collection for Prometheus monitoring."""
 
+import asyncio
 import os
+import time
 
-from prometheus_client import Counter, Gauge, Histogram, start_http_server
+from prometheus_client import (
+    GC_COLLECTOR,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    start_http_server,
+)
 
 logger = None
 
+# Resolved once at import instead of on every Metrics() construction
+_METRICS_ENABLED_ENV = os.getenv("METRICS_ENABLED", "true").strip().lower() == "true"
+
 
 class Metrics:
     """Prometheus metrics for trading bot."""
 
-    def __init__(self, enabled: bool = True, port: int = 9090):
+    def __init__(self, enabled: bool = True, port: int = 9090, start_server: bool = True):
         """Initialize metrics.
 
         Args:
             enabled: Whether to enable metrics collection
             port: Port to expose metrics on
+            start_server: Start the HTTP server now; otherwise call start_server()
         """
-        self.enabled = (
-            enabled and os.getenv("METRICS_ENABLED", "true").lower() == "true"
-        )
+        self.enabled = enabled and _METRICS_ENABLED_ENV
         self.port = port
+        self._server_started = False
 
         if self.enabled:
             self._init_metrics()
-            self._start_server()
+            if start_server:
+                self.start_server()
         else:
             logger = self._get_logger()
             logger.info("metrics_disabled")
@@ -95,10 +108,28 @@ class Metrics:
             ["endpoint"],
         )
 
-    def _start_server(self):
-        """Start Prometheus metrics server."""
+        self.event_loop_lag = Histogram(
+            "polymarket_event_loop_lag_seconds",
+            "Delay between scheduled wake and actual wake",
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0),
+        )
+
+    def start_server(self) -> None:
+        """Start Prometheus metrics server (no-op if disabled or already running)."""
+        if not self.enabled or self._server_started:
+            return
+
+        # The GC collector walks interpreter state on every scrape; the bot's
+        # own metrics already cover what we monitor, so drop it.
+        # Process and platform collectors are cheap and kept.
+        try:
+            REGISTRY.unregister(GC_COLLECTOR)
+        except KeyError:
+            pass
+
         try:
             start_http_server(self.port)
+            self._server_started = True
             self._get_logger().info("metrics_server_started", port=self.port)
         except Exception as e:
             self._get_logger().error("metrics_server_failed", error=str(e))
@@ -139,6 +170,31 @@ class Metrics:
         if self.enabled:
             self.positions_open.set(count)
 
+    def snapshot(
+        self,
+        balance: float,
+        daily_pnl: float,
+        total_pnl: float,
+        win_rate: float,
+        open_positions: int,
+    ) -> None:
+        """Update all bankroll gauges in a single call.
+
+        Args:
+            balance: Current account balance in USD
+            daily_pnl: Daily profit/loss in USD
+            total_pnl: Total profit/loss in USD
+            win_rate: Win rate as percentage
+            open_positions: Number of currently open positions
+        """
+        if not self.enabled:
+            return
+        self.balance.set(balance)
+        self.daily_pnl.set(daily_pnl)
+        self.total_pnl.set(total_pnl)
+        self.win_rate.set(win_rate)
+        self.positions_open.set(open_positions)
+
     def record_execution_time(self, side: str, seconds: float) -> None:
         """Record trade execution time."""
         if self.enabled:
@@ -149,5 +205,28 @@ class Metrics:
         if self.enabled:
             self.api_latency.labels(endpoint=endpoint).observe(seconds)
 
+    def record_event_loop_lag(self, seconds: float) -> None:
+        """Record event loop lag."""
+        if self.enabled:
+            self.event_loop_lag.observe(seconds)
+
+
+# Importing this module must not bind a port: the process that exports
+# metrics calls metrics.start_server() itself
+metrics = Metrics(start_server=False)
+
+
+async def probe_event_loop_lag(interval: float = 1.0) -> None:
+    """Sample event loop lag until cancelled.
+
+    Sleeps for ``interval`` seconds and records how late the wake-up was,
+    which exposes starvation of the loop by blocking work.
 
-metrics = Metrics()
+    Args:
+        interval: Sampling interval in seconds
+    """
+    while True:
+        started = time.monotonic()
+        await asyncio.sleep(interval)
+        lag = time.monotonic() - started - interval
+        metrics.record_event_loop_lag(max(lag, 0.0))
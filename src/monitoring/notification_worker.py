@@ -17,33 +17,41 @@ ENRICH_MAX_ATTEMPTS = 3
 SEND_MAX_ATTEMPTS = 5
 
 
-async def resolve_market_url(market_id: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+async def resolve_market_url(
+    market_id: str,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Resolve market URL and group_item_title from market_id.
 
+    Args:
+        market_id: Market (condition) ID
+        session: Shared HTTP session; a temporary one is used when omitted
+
     Returns:
         Tuple of (url, group_item_title, error_message).
         On success: (url, group_item_title, None).
         On failure: (None, None, error_description).
     """
-    import os
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await resolve_market_url(market_id, own_session)
 
     clob_url = f"https://clob.polymarket.com/markets/{market_id}"
     timeout = aiohttp.ClientTimeout(total=5)
 
     # Step 1: CLOB — get market_slug
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                clob_url,
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=timeout,
-            ) as resp:
-                if resp.status != 200:
-                    return None, None, f"CLOB returned {resp.status}"
-                clob_data = await resp.json()
-                market_slug = clob_data.get("market_slug")
-                if not market_slug:
-                    return None, None, "CLOB: no market_slug found"
+        async with session.get(
+            clob_url,
+            headers={"User-Agent": "Mozilla/5.0"},
+            timeout=timeout,
+        ) as resp:
+            if resp.status != 200:
+                return None, None, f"CLOB returned {resp.status}"
+            clob_data = await resp.json()
+            market_slug = clob_data.get("market_slug")
+            if not market_slug:
+                return None, None, "CLOB: no market_slug found"
     except asyncio.TimeoutError:
         return None, None, "CLOB timeout"
     except Exception as e:
@@ -52,26 +60,25 @@ async def resolve_market_url(market_id: str) -> Tuple[Optional[str], Optional[st
     # Step 2: Gamma — get events[0].slug and groupItemTitle
     gamma_url = f"https://gamma-api.polymarket.com/markets/slug/{market_slug}"
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                gamma_url,
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=timeout,
-            ) as resp:
-                if resp.status != 200:
-                    return None, None, f"Gamma returned {resp.status}"
-                gamma_data = await resp.json()
-                if not gamma_data:
-                    return None, None, "Gamma: empty response"
-                events = gamma_data.get("events", [])
-                if not events or len(events) == 0:
-                    return None, None, "Gamma: no events array or empty"
-                event_slug = events[0].get("slug")
-                if not event_slug:
-                    return None, None, "Gamma: events[0].slug missing"
-                group_item_title = gamma_data.get("groupItemTitle")
-                url = f"https://polymarket.com/event/{event_slug}"
-                return url, group_item_title, None
+        async with session.get(
+            gamma_url,
+            headers={"User-Agent": "Mozilla/5.0"},
+            timeout=timeout,
+        ) as resp:
+            if resp.status != 200:
+                return None, None, f"Gamma returned {resp.status}"
+            gamma_data = await resp.json()
+            if not gamma_data:
+                return None, None, "Gamma: empty response"
+            events = gamma_data.get("events", [])
+            if not events or len(events) == 0:
+                return None, None, "Gamma: no events array or empty"
+            event_slug = events[0].get("slug")
+            if not event_slug:
+                return None, None, "Gamma: events[0].slug missing"
+            group_item_title = gamma_data.get("groupItemTitle")
+            url = f"https://polymarket.com/event/{event_slug}"
+            return url, group_item_title, None
     except asyncio.TimeoutError:
         return None, None, "Gamma timeout"
     except Exception as e:
@@ -97,8 +104,17 @@ class NotificationWorker:
         self.database_url = database_url
         self.poll_interval = poll_interval
         self.batch_size = batch_size
-        self._engine = create_engine(database_url)
+        self._engine = create_engine(
+            database_url,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args={"application_name": "notification_worker"},
+        )
         self._telegram = TelegramAlerts()
+        # Kept open across notifications so CLOB/Gamma lookups reuse connections
+        self._http: Optional[aiohttp.ClientSession] = None
         self._running = False
 
     async def start(self) -> None:
@@ -106,13 +122,19 @@ class NotificationWorker:
         self._running = True
         logger.info("notification_worker_started", poll_interval=self.poll_interval)
 
-        while self._running:
-            try:
-                await self._process_notifications()
-            except Exception as e:
-                logger.error("notification_worker_error", error=str(e))
-
-            await asyncio.sleep(self.poll_interval)
+        try:
+            while self._running:
+                try:
+                    await self._process_notifications()
+                except Exception as e:
+                    logger.error("notification_worker_error", error=str(e))
+
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            if self._http and not self._http.closed:
+                await self._http.close()
+            self._http = None
+            await self._telegram.close()
 
     def stop(self) -> None:
         """Stop the notification worker."""
@@ -158,7 +180,11 @@ class NotificationWorker:
         whale_address = row.whale_address
 
         # Step 1: Enrich — resolve market URL
-        url, group_item_title, enrich_error = await resolve_market_url(row.market_id)
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession()
+        url, group_item_title, enrich_error = await resolve_market_url(
+            row.market_id, self._http
+        )
 
         if enrich_error:
             attempt_count += 1
@@ -254,7 +280,7 @@ class NotificationWorker:
                 source=row.source,
             )
         else:
-            # _send_message returned False — treat as send failure with backoff
+            # _send_raw returned False — treat as send failure with backoff
             attempt_count += 1
             if attempt_count >= SEND_MAX_ATTEMPTS:
                 conn.execute(
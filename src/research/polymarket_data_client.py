@@ -13,6 +13,7 @@ Example:
     ...     print(f"{trade.trader}: ${trade.size_usd}")
 """
 
+import asyncio
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
@@ -23,12 +24,37 @@ from aiohttp import ClientTimeout
 
 from src.config.settings import settings
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to aiohttp's stdlib json decoding
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
 DATA_API_BASE = "https://data-api.polymarket.com"
 
 
-@dataclass
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        response: aiohttp response with a JSON body
+
+    Returns:
+        Decoded JSON payload
+
+    Raises:
+        PolymarketDataError: If the body is not valid JSON
+    """
+    if orjson is None:
+        return await response.json()
+    try:
+        return orjson.loads(await response.read())
+    except orjson.JSONDecodeError as e:
+        raise PolymarketDataError(f"Invalid JSON response: {e}") from e
+
+
+@dataclass(slots=True)
 class TradeWithAddress:
     """Single trade from Polymarket Data API.
 
@@ -53,9 +79,9 @@ class TradeWithAddress:
     asset: str
     condition_id: str
     side: str
-    size: Decimal
-    price: Decimal
-    size_usd: Decimal
+    size: float
+    price: float
+    size_usd: float
     timestamp: int
     market_title: str
     outcome: str
@@ -63,7 +89,7 @@ class TradeWithAddress:
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedTraderStats:
     """Aggregated stats for a trader address.
 
@@ -80,8 +106,8 @@ class AggregatedTraderStats:
 
     address: str
     total_trades: int = 0
-    total_volume_usd: Decimal = Decimal("0")
-    avg_trade_size_usd: Decimal = Decimal("0")
+    total_volume_usd: float = 0.0
+    avg_trade_size_usd: float = 0.0
     buy_count: int = 0
     sell_count: int = 0
     last_seen: Optional[int] = None
@@ -129,7 +155,20 @@ class PolymarketDataClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            headers = {}
+            if self.api_key:
+                headers["Authorization"] = f"Bearer {self.api_key}"
+            # One pooled connector per client: recent + per-trader fetches
+            # reuse TLS connections and cached DNS for data-api.polymarket.com
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                headers=headers,
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+            )
         return self._session
 
     async def close(self) -> None:
@@ -159,13 +198,9 @@ class PolymarketDataClient:
         url = f"{self.BASE_URL}/trades"
         params = {"limit": limit}
 
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-
         session = await self._get_session()
         try:
-            async with session.get(url, params=params, headers=headers) as response:
+            async with session.get(url, params=params) as response:
                 if response.status != 200:
                     error_text = await response.text()
                     logger.error(
@@ -175,15 +210,12 @@ class PolymarketDataClient:
                     )
                     raise PolymarketDataError(f"API error: {response.status}")
 
-                data = await response.json()
+                data = await _read_json(response)
 
                 if not isinstance(data, list):
                     data = [data]
 
-                trades = self._parse_trades(data)
-
-                if min_size_usd:
-                    trades = [t for t in trades if t.size_usd >= min_size_usd]
+                trades = self._parse_trades(data, min_size_usd=min_size_usd)
 
                 logger.info(
                     "polymarket_trades_fetched",
@@ -197,11 +229,19 @@ class PolymarketDataClient:
             logger.error("polymarket_request_failed", error=str(e))
             raise PolymarketDataError(f"Request failed: {e}") from e
 
-    def _parse_trades(self, data: List[Dict[str, Any]]) -> List[TradeWithAddress]:
+    def _parse_trades(
+        self,
+        data: List[Dict[str, Any]],
+        min_size_usd: Optional[Decimal] = None,
+    ) -> List[TradeWithAddress]:
         """Parse trades from API response.
 
+        Items below ``min_size_usd`` are dropped before a TradeWithAddress is
+        built for them.
+
         Args:
             data: Raw API response
+            min_size_usd: Minimum trade size in USD to keep
 
         Returns:
             List of TradeWithAddress objects
@@ -214,17 +254,14 @@ class PolymarketDataClient:
                 if not trader:
                     continue
 
-                size_str = str(item.get("size", 0))
-                price_str = str(item.get("price", 0))
-
-                size = Decimal(size_str) if size_str else Decimal("0")
-                price = Decimal(price_str) if price_str else Decimal("0")
-                usdc_size_str = item.get("usdcSize")
-                size_usd = (
-                    Decimal(str(usdc_size_str))
-                    if usdc_size_str is not None
-                    else size * price
-                )
+                # API numbers are already lossy JSON floats; callers that
+                # persist them convert to Decimal at the DB boundary
+                size = float(item.get("size") or 0.0)
+                price = float(item.get("price") or 0.0)
+                usdc_size = item.get("usdcSize")
+                size_usd = float(usdc_size) if usdc_size is not None else size * price
+                if min_size_usd and size_usd < min_size_usd:
+                    continue
 
                 trade = TradeWithAddress(
                     trader=trader.lower(),
@@ -281,17 +318,13 @@ class PolymarketDataClient:
                 "type": "TRADE",
             }
 
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-
         session = await self._get_session()
         try:
-            async with session.get(url, params=params, headers=headers) as response:
+            async with session.get(url, params=params) as response:
                 if response.status != 200:
                     raise PolymarketDataError(f"API error: {response.status}")
 
-                data = await response.json()
+                data = await _read_json(response)
 
                 if not isinstance(data, list):
                     data = [data]
@@ -310,6 +343,48 @@ class PolymarketDataClient:
             logger.error("polymarket_request_failed", error=str(e))
             raise PolymarketDataError(f"Request failed: {e}") from e
 
+    async def fetch_many_trader_trades(
+        self,
+        trader_addresses: List[str],
+        limit: int = 100,
+        max_concurrency: int = 16,
+    ) -> Dict[str, List[TradeWithAddress]]:
+        """Fetch trades for several traders concurrently.
+
+        Args:
+            trader_addresses: Trader wallet addresses
+            limit: Max number of trades per trader
+            max_concurrency: Max requests in flight at once
+
+        Returns:
+            Dict mapping lowercased address to its trades. Addresses whose
+            fetch failed are logged and left out.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(address: str) -> List[TradeWithAddress]:
+            async with semaphore:
+                return await self.fetch_trader_trades(address, limit=limit)
+
+        addresses = list(dict.fromkeys(a.lower() for a in trader_addresses))
+        results = await asyncio.gather(
+            *(fetch_one(address) for address in addresses),
+            return_exceptions=True,
+        )
+
+        trades_by_address: Dict[str, List[TradeWithAddress]] = {}
+        for address, result in zip(addresses, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "polymarket_trader_trades_failed",
+                    trader=address[:10],
+                    error=str(result),
+                )
+                continue
+            trades_by_address[address] = result
+
+        return trades_by_address
+
     async def aggregate_by_address(
         self,
         limit: int = 100,
@@ -326,17 +401,17 @@ class PolymarketDataClient:
         """
         trades = await self.fetch_recent_trades(limit=limit, min_size_usd=min_size_usd)
 
+        # Single pass: one dict probe per trade, no per-trade conversions
         aggregated: Dict[str, AggregatedTraderStats] = {}
 
         for trade in trades:
-            address = trade.trader
-            if address not in aggregated:
-                aggregated[address] = AggregatedTraderStats(address=address)
+            stats = aggregated.get(trade.trader)
+            if stats is None:
                 # Collect name from first trade
-                if trade.name:
-                    aggregated[address].name = trade.name
+                stats = aggregated[trade.trader] = AggregatedTraderStats(
+                    address=trade.trader, name=trade.name or ""
+                )
 
-            stats = aggregated[address]
             stats.total_trades += 1
             stats.total_volume_usd += trade.size_usd
 
@@ -349,15 +424,12 @@ class PolymarketDataClient:
                 stats.last_seen = trade.timestamp
 
         for stats in aggregated.values():
-            if stats.total_trades > 0:
-                stats.avg_trade_size_usd = stats.total_volume_usd / Decimal(
-                    stats.total_trades
-                )
+            stats.avg_trade_size_usd = stats.total_volume_usd / stats.total_trades
 
         logger.info(
             "polymarket_aggregated",
             unique_traders=len(aggregated),
-            total_trades=sum(s.total_trades for s in aggregated.values()),
+            total_trades=len(trades),
         )
 
         return aggregated
@@ -4,6 +4,9 @@
 Monitors Polymarket WebSocket for whale trades and forwards
 signals to copy trading engine with delay tracking.
 
+The monitor runs on whatever loop is current; the entry point
+(src/run_whale_detection.py) installs uvloop when it is available.
+
 Example:
     >>> from research.real_time_whale_monitor import RealTimeWhaleMonitor
     >>>
@@ -19,12 +22,15 @@ Example:
 """
 
 import asyncio
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional, Set
-from uuid import uuid4
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set
 
 import asyncpg
 import structlog
@@ -39,17 +45,43 @@ from src.data.storage.market_title_cache import get_market_title
 from src.data.storage.market_category_cache import get_market_category
 from src.config.settings import settings
 from src.research.polymarket_data_client import PolymarketDataClient
-from src.db.whale_trades_repo import WhaleTradesRepo
+from src.db.whale_trades_repo import WhaleTradesRepo, is_connection_error
 
 logger = structlog.get_logger(__name__)
 
+# Signals live only inside this process, so a counter is enough for unique ids
+_signal_seq = itertools.count(1)
+
+
+def _next_signal_id() -> str:
+    return f"{next(_signal_seq):08x}"
+
+
+class _TokenBucket:
+    """Token bucket refilled at `rate` tokens/s, holding at most `burst`."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
 
-@dataclass
+    def try_consume(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+
+@dataclass(slots=True)
 class WhaleTradeSignal:
     """Represents a detected whale trade from WebSocket.
 
     Attributes:
-        signal_id: Unique signal identifier
+        signal_id: Process-unique signal identifier
         market_id: Market/token identifier
         side: Trade side ("buy" or "sell")
         size_usd: Trade size in USD
@@ -69,7 +101,7 @@ class WhaleTradeSignal:
     delay_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitorStats:
     """Statistics for whale monitor.
 
@@ -94,6 +126,10 @@ class RealTimeWhaleMonitor:
     Monitors WebSocket for large trades and forwards signals
     to copy trading engine with delay tracking.
 
+    The feed is consumed with permessage-deflate disabled by default:
+    at high message rates inflating every frame costs more CPU than the
+    extra bandwidth.
+
     Attributes:
         WS_URL: Polymarket WebSocket endpoint
         MAX_ACCEPTABLE_DELAY_MS: Maximum acceptable delay (10 seconds)
@@ -101,6 +137,14 @@ class RealTimeWhaleMonitor:
 
     WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
     MAX_ACCEPTABLE_DELAY_MS = 10000
+    SIGNAL_QUEUE_MAX_SIZE = 10_000
+    STOP_DRAIN_TIMEOUT_SECONDS = 10.0  # How long stop() waits for queued signals
+    DELAY_WINDOW_SIZE = 1000
+    TRADER_CACHE_MAX_SIZE = 100_000
+    DB_FLUSH_INTERVAL_SECONDS = 0.5
+    DB_FLUSH_MAX_ROWS = 500
+    DB_BUFFER_MAX_ROWS = 10_000  # Cap on rows kept for retry while the DB is down
+    LOG_SUMMARY_INTERVAL_SECONDS = 5.0
 
     def __init__(
         self,
@@ -110,6 +154,7 @@ class RealTimeWhaleMonitor:
         whale_tracker: Optional[WhaleTracker] = None,
         tracked_whales: Optional[Set[str]] = None,
         api_key: Optional[str] = None,
+        compression: Optional[str] = None,
     ) -> None:
         """Initialize Real-time Whale Monitor.
 
@@ -120,13 +165,19 @@ class RealTimeWhaleMonitor:
             whale_tracker: WhaleTracker instance for whale filtering
             tracked_whales: Set of whale addresses to monitor
             api_key: Optional API key for authenticated requests
+            compression: WebSocket compression ("deflate" or None to disable)
         """
         self.min_trade_size = min_trade_size
+        # Float copy for the per-trade size gate; Decimal is built only for hits
+        self._min_trade_size_f = float(min_trade_size)
         self.on_whale_signal = on_whale_signal
         self.database_url = database_url
         self.whale_tracker = whale_tracker
-        self.tracked_whales = tracked_whales or set()
         self.api_key = api_key
+        self.compression = compression
+        # raw address -> passes tracked/quality filter; reset on tracking changes
+        self._trader_cache: Dict[str, bool] = {}
+        self.tracked_whales = tracked_whales or set()
 
         # Whale poller dependencies
         self._db_pool: Optional[asyncpg.Pool] = None
@@ -137,27 +188,63 @@ class RealTimeWhaleMonitor:
         self._ws: Optional[PolymarketWebSocket] = None
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        # Signals are handed from the sync WebSocket callback to one consumer
+        # task instead of spawning a Task per signal
+        self._signal_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=self.SIGNAL_QUEUE_MAX_SIZE
+        )
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._signals_dropped = 0
         self._engine = None
         self._Session = None
         self._whale_trades_repo: Optional[WhaleTradesRepo] = None
-        self._delays: List[float] = []
-        self._lock = asyncio.Lock()
+        # whale_trades rows are buffered and written in batches by _db_flush_loop
+        self._db_buffer: List[Dict[str, Any]] = []
+        # Validated rows whose write failed on a connection error, retried first
+        self._db_retry_rows: List[Dict[str, Any]] = []
+        self._db_flush_event = asyncio.Event()
+        self._db_flush_task: Optional[asyncio.Task] = None
+        # One writer thread keeps batches ordered and off the event loop
+        self._db_executor: Optional[ThreadPoolExecutor] = None
+        # Rolling window of detection delays with a running sum for avg_delay_ms
+        self._delays: deque = deque(maxlen=self.DELAY_WINDOW_SIZE)
+        self._delay_sum = 0.0
 
         self.stats = MonitorStats()
+        # event_type -> handler; untyped book messages fall back to bids/asks keys
+        self._handlers: Dict[str, Callable[[Dict[str, Any], float], None]] = {
+            "trade": self._process_ws_trade,
+            "order": self._process_orderbook_update,
+        }
+        # whale_trade_detected lines are capped; the rest are counted and summarized
+        self._log_limiter = _TokenBucket(rate=50, burst=200)
+        self._log_suppressed = 0
+        self._log_summary_at = time.monotonic()
 
         logger.info(
             "whale_monitor_initialized",
             min_trade_size=str(min_trade_size),
-            tracked_whales=len(self.tracked_whales),
+            tracked_whales=len(self._tracked_whales),
         )
 
     def set_database(self, database_url: str) -> None:
         """Set database URL and initialize connection."""
         self.database_url = database_url
-        self._engine = create_engine(database_url)
+        self._init_repo()
+        logger.info("whale_monitor_database_configured")
+
+    def _init_repo(self) -> None:
+        """Create engine, session factory and WhaleTradesRepo for database_url."""
+        engine_kwargs: Dict[str, Any] = {
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+            "connect_args": {"application_name": "real_time_whale_monitor"},
+        }
+        self._engine = create_engine(self.database_url, **engine_kwargs)
         self._Session = sessionmaker(bind=self._engine)
         self._whale_trades_repo = WhaleTradesRepo(session_factory=self._Session)
-        logger.info("whale_monitor_database_configured")
 
     async def _init_whale_poller(self) -> None:
         """Инициализировать whale poller."""
@@ -228,24 +315,34 @@ class RealTimeWhaleMonitor:
         )
         logger.info("whale_poller_initialized")
 
+    @property
+    def tracked_whales(self) -> FrozenSet[str]:
+        """Tracked whale addresses (read-only view; see add/remove_tracked_whale)."""
+        return frozenset(self._tracked_whales)
+
+    @tracked_whales.setter
+    def tracked_whales(self, addresses: Set[str]) -> None:
+        self._tracked_whales = set(addresses)
+        self._trader_cache.clear()
+
     def add_tracked_whale(self, address: str) -> None:
         """Add whale address to track."""
-        self.tracked_whales.add(address.lower())
+        self._tracked_whales.add(address.lower())
+        self._trader_cache.clear()
         logger.info("whale_added_to_monitor", address=address[:10])
 
     def remove_tracked_whale(self, address: str) -> None:
         """Remove whale address from tracking."""
-        self.tracked_whales.discard(address.lower())
+        self._tracked_whales.discard(address.lower())
+        self._trader_cache.clear()
         logger.info("whale_removed_from_monitor", address=address[:10])
 
     async def _ensure_database(self) -> None:
-        """Ensure database connection is available."""
+        """Create the whale_trades repo once, before signals start flowing."""
         if not self.database_url:
             return
         if not self._engine:
-            self._engine = create_engine(self.database_url)
-            self._Session = sessionmaker(bind=self._engine)
-            self._whale_trades_repo = WhaleTradesRepo(session_factory=self._Session)
+            self._init_repo()
 
     async def start(self, token_ids: Optional[List[str]] = None) -> None:
         """Start monitoring whale trades.
@@ -257,10 +354,17 @@ class RealTimeWhaleMonitor:
             logger.warning("whale_monitor_already_running")
             return
 
+        await self._ensure_database()
         self._running = True
+        self._consumer_task = asyncio.create_task(self._signal_consumer())
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whale_trades_writer"
+        )
+        self._db_flush_task = asyncio.create_task(self._db_flush_loop())
         self._ws = PolymarketWebSocket(
             api_key=self.api_key,
             on_message=self._handle_message,
+            compression=self.compression,
         )
 
         try:
@@ -283,6 +387,12 @@ class RealTimeWhaleMonitor:
         except Exception as e:
             logger.error("whale_monitor_start_failed", error=str(e))
             self._running = False
+            self._consumer_task.cancel()
+            self._consumer_task = None
+            self._db_flush_task.cancel()
+            self._db_flush_task = None
+            self._db_executor.shutdown(wait=False)
+            self._db_executor = None
             raise
 
     async def stop(self) -> None:
@@ -310,6 +420,39 @@ class RealTimeWhaleMonitor:
         if self._ws:
             await self._ws.disconnect()
 
+        # Let the consumer handle signals already queued before cancelling it
+        if self._consumer_task and not self._consumer_task.done():
+            try:
+                await asyncio.wait_for(
+                    self._signal_queue.join(), timeout=self.STOP_DRAIN_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "whale_signal_drain_timeout",
+                    pending=self._signal_queue.qsize(),
+                    timeout=self.STOP_DRAIN_TIMEOUT_SECONDS,
+                )
+
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+            self._consumer_task = None
+
+        if self._db_flush_task:
+            self._db_flush_task.cancel()
+            try:
+                await self._db_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._db_flush_task = None
+        await self._flush_db_buffer()
+        if self._db_executor:
+            self._db_executor.shutdown(wait=False)
+            self._db_executor = None
+
         logger.info("whale_monitor_stopped", stats=self._get_stats())
 
     async def _monitor_loop(self) -> None:
@@ -345,33 +488,31 @@ class RealTimeWhaleMonitor:
     def _process_single_message(self, data: Dict[str, Any], received_at: float) -> None:
         """Process a single message item."""
         try:
-            event_type = data.get("event_type", "")
-
-            if event_type == "trade":
-                self._process_ws_trade(data, received_at)
-            elif event_type == "order" or "bids" in data or "asks" in data:
+            handler = self._handlers.get(data.get("event_type"))
+            if handler is not None:
+                handler(data, received_at)
+            elif "bids" in data or "asks" in data:
                 self._process_orderbook_update(data, received_at)
-            elif "price_changes" in data:
-                pass  # Price updates, not trades
-            elif "last_trade_price" in data:
-                pass  # Orderbook snapshot, not trade
+            # price_changes / last_trade_price: price updates, not trades
         except Exception as e:
             logger.debug("item_handling_error", error=str(e))
 
     def _process_ws_trade(self, data: Dict[str, Any], received_at: float) -> None:
         """Process trade from WebSocket message."""
+        price_raw = data.get("price", 0)
+        size_raw = data.get("size", 0)
+        if float(size_raw) * float(price_raw) < self._min_trade_size_f:
+            return
+
         asset_id = data.get("asset_id", "")
-        price = Decimal(str(data.get("price", 0)))
-        size = Decimal(str(data.get("size", 0)))
+        price = Decimal(str(price_raw))
+        size = Decimal(str(size_raw))
         side = data.get("side", "buy").lower()
 
-        if size * price < self.min_trade_size:
-            return
-
         timestamp = data.get("timestamp", received_at)
 
         signal = WhaleTradeSignal(
-            signal_id=str(uuid4()),
+            signal_id=_next_signal_id(),
             market_id=data.get("market", asset_id),
             side=side,
             size_usd=size * price,
@@ -381,7 +522,7 @@ class RealTimeWhaleMonitor:
             delay_ms=(received_at - timestamp) * 1000 if timestamp else 0,
         )
 
-        asyncio.create_task(self._handle_whale_signal(signal))
+        self._enqueue_signal(signal)
 
     def _process_trade_data(self, data: Dict[str, Any], received_at: float) -> None:
         """Process trade data from WebSocket message.
@@ -394,28 +535,24 @@ class RealTimeWhaleMonitor:
         if not trades:
             return
 
+        min_size = self._min_trade_size_f
         for trade in trades:
-            size_usd = Decimal(str(trade.get("size", 0)))
-            price = Decimal(str(trade.get("price", 0)))
-
-            if size_usd < self.min_trade_size:
+            size_raw = trade.get("size", 0)
+            if float(size_raw) < min_size:
                 continue
 
-            trader = trade.get("address", "").lower()
-            if self.tracked_whales and trader not in self.tracked_whales:
+            address = trade.get("address", "")
+            if not self._accept_trader(address):
                 continue
+            trader = address.lower()
 
-            if self.whale_tracker:
-                if not self.whale_tracker.is_quality_whale(
-                    self.whale_tracker.whale_stats.get(trader)
-                ):
-                    continue
-
+            size_usd = Decimal(str(size_raw))
+            price = Decimal(str(trade.get("price", 0)))
             trade_time = trade.get("timestamp", received_at)
             delay_ms = (received_at - trade_time) * 1000
 
             signal = WhaleTradeSignal(
-                signal_id=str(uuid4()),
+                signal_id=_next_signal_id(),
                 market_id=trade.get("conditionId", trade.get("tokenId", "")),
                 side=trade.get("side", "buy").lower(),
                 size_usd=size_usd,
@@ -425,21 +562,42 @@ class RealTimeWhaleMonitor:
                 delay_ms=delay_ms,
             )
 
-            asyncio.create_task(self._handle_whale_signal(signal))
+            self._enqueue_signal(signal)
+
+    def _accept_trader(self, address: str) -> bool:
+        """Check tracked-whale and quality filters, memoized per raw address.
+
+        Keyed by the address as received so cache hits skip .lower();
+        the cheap tracked-whale membership runs before the quality lookup.
+        """
+        accept = self._trader_cache.get(address)
+        if accept is None:
+            trader = address.lower()
+            accept = (not self._tracked_whales or trader in self._tracked_whales) and (
+                self.whale_tracker is None
+                or self.whale_tracker.is_quality_whale(
+                    self.whale_tracker.whale_stats.get(trader)
+                )
+            )
+            if len(self._trader_cache) >= self.TRADER_CACHE_MAX_SIZE:
+                self._trader_cache.clear()
+            self._trader_cache[address] = accept
+        return accept
 
     def _process_orderbook_update(
         self, data: Dict[str, Any], received_at: float
     ) -> None:
         """Process orderbook update for large orders."""
-        size = Decimal(str(data.get("size", 0)))
-        if size < self.min_trade_size:
+        size_raw = data.get("size", 0)
+        if float(size_raw) < self._min_trade_size_f:
             return
 
+        size = Decimal(str(size_raw))
         price = Decimal(str(data.get("price", 0)))
         side = data.get("side", "buy").lower()
 
         signal = WhaleTradeSignal(
-            signal_id=str(uuid4()),
+            signal_id=_next_signal_id(),
             market_id=data.get("conditionId", data.get("tokenId", "")),
             side=side,
             size_usd=size,
@@ -449,18 +607,48 @@ class RealTimeWhaleMonitor:
             delay_ms=0.0,
         )
 
-        asyncio.create_task(self._handle_whale_signal(signal))
-
-    async def _handle_whale_signal(self, signal: WhaleTradeSignal) -> None:
-        """Handle detected whale trade signal."""
-        async with self._lock:
-            self.stats.trades_detected += 1
-            self._delays.append(signal.delay_ms)
+        self._enqueue_signal(signal)
 
-            if len(self._delays) > 1000:
-                self._delays = self._delays[-1000:]
+    def _enqueue_signal(self, signal: WhaleTradeSignal) -> None:
+        """Queue signal for the consumer task, dropping it if the queue is full."""
+        self._fast_path(signal)
+        try:
+            self._signal_queue.put_nowait(signal)
+        except asyncio.QueueFull:
+            self._signals_dropped += 1
+            logger.warning(
+                "whale_signal_queue_full",
+                dropped_total=self._signals_dropped,
+                queue_size=self._signal_queue.qsize(),
+            )
 
-            self.stats.avg_delay_ms = sum(self._delays) / len(self._delays)
+    async def _signal_consumer(self) -> None:
+        """Handle queued whale signals one at a time."""
+        while True:
+            signal = await self._signal_queue.get()
+            try:
+                await self._handle_whale_signal(signal)
+            except Exception as e:
+                logger.error("whale_signal_handling_failed", error=str(e))
+            finally:
+                self._signal_queue.task_done()
+
+    def _fast_path(self, signal: WhaleTradeSignal) -> None:
+        """Update stats and check delay inline, before the signal is queued."""
+        self.stats.trades_detected += 1
+        delay_ms = signal.delay_ms
+        evicted = None
+        if len(self._delays) == self.DELAY_WINDOW_SIZE:
+            evicted = self._delays[0]
+            self._delay_sum -= evicted
+        self._delays.append(delay_ms)
+        self._delay_sum += delay_ms
+
+        self.stats.avg_delay_ms = self._delay_sum / len(self._delays)
+        if delay_ms >= self.stats.max_delay_ms:
+            self.stats.max_delay_ms = delay_ms
+        elif evicted == self.stats.max_delay_ms:
+            # The old maximum just left the window
             self.stats.max_delay_ms = max(self._delays)
 
         if signal.delay_ms > self.MAX_ACCEPTABLE_DELAY_MS:
@@ -472,6 +660,8 @@ class RealTimeWhaleMonitor:
                 max_acceptable=self.MAX_ACCEPTABLE_DELAY_MS,
             )
 
+    async def _handle_whale_signal(self, signal: WhaleTradeSignal) -> None:
+        """Handle detected whale trade signal: title, DB write and callback."""
         market_title = await get_market_title(signal.market_id)
         
         # Calculate outcome based on price and side (Polymarket binary convention)
@@ -486,15 +676,24 @@ class RealTimeWhaleMonitor:
             except Exception as e:
                 logger.error("whale_signal_callback_failed", error=str(e))
 
-        logger.info(
-            "whale_trade_detected",
-            signal_id=signal.signal_id[:8],
-            market=signal.market_id[:20],
-            side=signal.side,
-            size=str(signal.size_usd),
-            price=str(signal.price),
-            delay_ms=signal.delay_ms,
-        )
+        if self._log_limiter.try_consume():
+            logger.info(
+                "whale_trade_detected",
+                signal_id=signal.signal_id[:8],
+                market=signal.market_id[:20],
+                side=signal.side,
+                size=str(signal.size_usd),
+                price=str(signal.price),
+                delay_ms=signal.delay_ms,
+            )
+        else:
+            self._log_suppressed += 1
+
+        now = time.monotonic()
+        if self._log_suppressed and now - self._log_summary_at >= self.LOG_SUMMARY_INTERVAL_SECONDS:
+            logger.info("whale_trade_logs_suppressed", count=self._log_suppressed)
+            self._log_suppressed = 0
+            self._log_summary_at = now
 
     async def _save_whale_signal_to_db(self, signal: WhaleTradeSignal, market_title: Optional[str] = None, outcome: Optional[str] = None) -> None:
         """Save whale signal to database using WhaleTradesRepo.
@@ -504,33 +703,86 @@ class RealTimeWhaleMonitor:
             market_title: Market question/title from Polymarket API (optional)
             outcome: Trade outcome (Yes/No). If API returns Up/Down, convert using: outcomeIndex 0 = Yes, 1 = No
         """
-        # Ensure repo exists
+        # Repo is created once in start() (or set_database)
         if self._whale_trades_repo is None:
-            if not self.database_url:
-                logger.warning("whale_signal_save_skipped_no_db")
-                return
-            self._engine = create_engine(self.database_url)
-            self._Session = sessionmaker(bind=self._engine)
-            self._whale_trades_repo = WhaleTradesRepo(session_factory=self._Session)
+            logger.warning("whale_signal_save_skipped_no_db")
+            return
 
         # Get market category (async call)
         market_category = await get_market_category(signal.market_id)
 
-        # Call synchronous save_trade method
+        # Row is written by _db_flush_loop together with the rest of the batch
+        self._db_buffer.append({
+            "wallet_address": signal.trader_address,
+            "market_id": signal.market_id,
+            "side": signal.side,
+            "size_usd": signal.size_usd,
+            "price": signal.price,
+            "outcome": outcome,
+            "market_title": market_title,
+            "market_category": market_category,
+            "source": "REALTIME",
+        })
+        if len(self._db_buffer) >= self.DB_FLUSH_MAX_ROWS:
+            self._db_flush_event.set()
+
+    async def _db_flush_loop(self) -> None:
+        """Flush buffered whale_trades rows every interval or when the buffer fills."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._db_flush_event.wait(), timeout=self.DB_FLUSH_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._db_flush_event.clear()
+            await self._flush_db_buffer()
+
+    async def _flush_db_buffer(self) -> None:
+        """Write buffered rows with a single WhaleTradesRepo batch.
+
+        The sync repo runs on the single writer thread so the event loop
+        keeps handling WebSocket messages while the batch is committed.
+        """
+        if self._whale_trades_repo is None or not (self._db_buffer or self._db_retry_rows):
+            return
+        batch, self._db_buffer = self._db_buffer, []
+        retry, self._db_retry_rows = self._db_retry_rows, []
+        unsaved = await asyncio.get_running_loop().run_in_executor(
+            self._db_executor, self._write_db_rows, batch, retry
+        )
+        if unsaved:
+            # Rows are fine, the database is not: keep them for the next flush
+            self._db_retry_rows[:0] = unsaved
+            dropped = len(self._db_retry_rows) - self.DB_BUFFER_MAX_ROWS
+            if dropped > 0:
+                del self._db_retry_rows[:dropped]
+                logger.error("whale_signal_rows_dropped", dropped=dropped)
+
+    def _write_db_rows(
+        self, batch: List[Dict[str, Any]], retry: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Validate batch and write it after retry rows (writer thread).
+
+        Rows are validated once; data errors are retried row by row inside
+        the repo, so only a connection error leaves rows to write later.
+
+        Returns:
+            Validated rows that were not written because of a connection error
+        """
+        repo = self._whale_trades_repo
+        _, prepared = repo.prepare_trades(batch)
+        rows = retry + prepared
         try:
-            self._whale_trades_repo.save_trade(
-                wallet_address=signal.trader_address,
-                market_id=signal.market_id,
-                side=signal.side,
-                size_usd=signal.size_usd,
-                price=signal.price,
-                outcome=outcome,
-                market_title=market_title,
-                market_category=market_category,
-                source="REALTIME",
-            )
+            repo.save_prepared_trades(rows)
         except Exception as e:
-            logger.debug("whale_signal_save_failed", error=str(e))
+            requeued = is_connection_error(e)
+            logger.error(
+                "whale_signal_save_failed", error=str(e), batch_size=len(rows), requeued=requeued
+            )
+            if requeued:
+                return rows
+        return []
 
     def _get_stats(self) -> Dict[str, Any]:
         """Get monitoring statistics."""
@@ -540,6 +792,7 @@ class RealTimeWhaleMonitor:
             "avg_delay_ms": self.stats.avg_delay_ms,
             "max_delay_ms": self.stats.max_delay_ms,
             "alerts_triggered": self.stats.alerts_triggered,
+            "signals_dropped": self._signals_dropped,
         }
 
     def get_stats(self) -> MonitorStats:
@@ -561,6 +814,10 @@ class RealTimeWhaleMonitor:
             logger.info("subscribed_to_markets", count=len(token_ids))
 
 
+def _signal_time(signal: WhaleTradeSignal) -> float:
+    return signal.timestamp
+
+
 class WhaleSignalBuffer:
     """Buffer for managing whale signals with deduplication."""
 
@@ -572,6 +829,8 @@ class WhaleSignalBuffer:
         """
         self.dedup_window = dedup_window_seconds
         self._signals: Dict[str, WhaleTradeSignal] = {}
+        # Same signals ordered by timestamp so get_recent can bisect the cutoff
+        self._by_time: List[WhaleTradeSignal] = []
         self._lock = asyncio.Lock()
 
     async def add(self, signal: WhaleTradeSignal) -> bool:
@@ -586,15 +845,24 @@ class WhaleSignalBuffer:
         async with self._lock:
             key = f"{signal.market_id}:{signal.trader_address}:{signal.side}"
 
-            for existing_key, existing_signal in list(self._signals.items()):
-                if existing_key == key:
-                    if signal.timestamp - existing_signal.timestamp < self.dedup_window:
-                        return False
-                    del self._signals[existing_key]
+            existing = self._signals.get(key)
+            if existing is not None:
+                if signal.timestamp - existing.timestamp < self.dedup_window:
+                    return False
+                del self._signals[key]
+                self._remove_by_time(existing)
 
             self._signals[key] = signal
+            bisect.insort(self._by_time, signal, key=_signal_time)
             return True
 
+    def _remove_by_time(self, signal: WhaleTradeSignal) -> None:
+        """Remove exactly this signal object from the time index."""
+        i = bisect.bisect_left(self._by_time, signal.timestamp, key=_signal_time)
+        while self._by_time[i] is not signal:
+            i += 1
+        del self._by_time[i]
+
     async def get_recent(self, seconds: float = 60.0) -> List[WhaleTradeSignal]:
         """Get recent signals from buffer.
 
@@ -605,10 +873,12 @@ class WhaleSignalBuffer:
             List of recent signals
         """
         async with self._lock:
-            now = time.time()
-            return [s for s in self._signals.values() if now - s.timestamp < seconds]
+            cutoff = time.time() - seconds
+            i = bisect.bisect_right(self._by_time, cutoff, key=_signal_time)
+            return self._by_time[i:]
 
     async def clear(self) -> None:
         """Clear the buffer."""
         async with self._lock:
             self._signals.clear()
+            self._by_time.clear()
@@ -20,13 +20,21 @@ Example:
 """
 
 import asyncio
+import bisect
+import copy
+import dataclasses
+import functools
+import logging
 import os
+import sys
 import time
-from collections import defaultdict
-from dataclasses import dataclass
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import structlog
 from sqlalchemy import create_engine, text
@@ -37,12 +45,30 @@ from src.data.storage.market_title_cache import get_market_title
 from src.data.storage.market_tokens_cache import get_token_outcome_index
 from src.data.storage.category_backfill import backfill_market_categories
 from src.research.polymarket_data_client import (
+    AggregatedTraderStats,
     PolymarketDataClient,
 )
-from src.research.whale_tracker import calculate_risk_score
-from src.db.whale_trades_repo import WhaleTradesRepo
+from src.research.whale_tracker import (
+    RISK_ACTIVE_TRADES,
+    RISK_ACTIVE_VOLUME,
+    RISK_ELITE_TOP_TRADES,
+    RISK_ELITE_TRADES,
+    RISK_ELITE_TRADES_PER_DAY,
+    RISK_ELITE_VOLUME,
+    RISK_GOOD_TOP_TRADES,
+    RISK_GOOD_TRADES,
+    RISK_GOOD_VOLUME,
+    RISK_LOW_TRADES,
+    RISK_MODERATE_TRADES,
+    RISK_MODERATE_VOLUME,
+    calculate_risk_score,
+)
+from src.db.whale_trades_repo import WhaleTradesRepo, is_connection_error
 
 logger = structlog.get_logger(__name__)
+# Level checks for hot call sites: structlog's filter_by_level defers to this
+# stdlib logger, so skipping here avoids building event dicts that get dropped
+_std_logger = logging.getLogger(__name__)
 
 
 def normalize_outcome(
@@ -103,8 +129,19 @@ def normalize_outcome(
 # Keep backward compatibility alias
 convert_outcome_to_yes_no = normalize_outcome
 
+# In-memory USD sums are ints in 1e-8 USD units, matching DECIMAL(20, 8) in whales
+_USD_SCALE = 8
+
+
+def _to_usd_units(amount: Decimal) -> int:
+    return int(amount.scaleb(_USD_SCALE))
+
 
-@dataclass
+def _from_usd_units(units: int) -> Decimal:
+    return Decimal(units).scaleb(-_USD_SCALE)
+
+
+@dataclass(slots=True)
 class TradeRecord:
     """Record of a single trade for whale detection.
 
@@ -123,9 +160,229 @@ class TradeRecord:
     size_usd: Decimal
     price: Decimal
     timestamp: float
+    size_units: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.size_units = _to_usd_units(self.size_usd)
+
+
+# Records evicted from a trader window are reused for new trades instead of
+# allocating one per trade (single event loop, so no lock is needed)
+_TRADE_POOL_MAX_SIZE = 10_000
+_trade_pool: deque = deque(maxlen=_TRADE_POOL_MAX_SIZE)
+
+
+def _new_trade_record(
+    trader: str,
+    market_id: str,
+    side: str,
+    size_usd: Decimal,
+    price: Decimal,
+    timestamp: float,
+) -> TradeRecord:
+    """TradeRecord from the pool, or a fresh one when the pool is empty."""
+    trade = _trade_pool.pop() if _trade_pool else TradeRecord.__new__(TradeRecord)
+    trade.trader = trader
+    trade.market_id = market_id
+    trade.side = side
+    trade.size_usd = size_usd
+    trade.price = price
+    trade.timestamp = timestamp
+    trade.size_units = _to_usd_units(size_usd)
+    return trade
+
+
+# Decimal thresholds of the qualification gates, built once rather than per call
+_QUALITY_MIN_TRADES = 10
+_QUALITY_MIN_VOLUME_USD = Decimal("500")
+_CONVICTION_MIN_VOLUME_USD = Decimal("10000")
+_CONVICTION_MIN_AVG_TRADE_USD = Decimal("2000")
+
+
+def _qualification_path(
+    total_trades: int,
+    total_volume_usd: Decimal,
+    avg_trade_size_usd: Decimal,
+    trades_last_7_days: int,
+    days_active: int,
+    risk_score: int,
+) -> Optional[str]:
+    """Dual-path qualification gates (see WhaleDetector._calculate_qualification_path)."""
+    if risk_score > 6 or days_active < 1:
+        return None
+    if (
+        total_trades >= _QUALITY_MIN_TRADES
+        and total_volume_usd >= _QUALITY_MIN_VOLUME_USD
+        and trades_last_7_days >= 3
+    ):
+        return "ACTIVE"
+    if (
+        total_volume_usd >= _CONVICTION_MIN_VOLUME_USD
+        and avg_trade_size_usd >= _CONVICTION_MIN_AVG_TRADE_USD
+        and trades_last_7_days >= 1
+    ):
+        return "CONVICTION"
+    return None
+
+
+# Cut-offs used by calculate_risk_score and the qualification gates. Stats
+# between two consecutive cut-offs always get the same decision, so the
+# decision is memoized on the tier index instead of the raw values.
+_TRADE_TIERS = tuple(sorted({
+    0, _QUALITY_MIN_TRADES, RISK_LOW_TRADES, RISK_ACTIVE_TRADES, RISK_MODERATE_TRADES,
+    RISK_GOOD_TRADES, RISK_GOOD_TOP_TRADES, RISK_ELITE_TRADES, RISK_ELITE_TOP_TRADES,
+}))
+_VOLUME_TIERS = tuple(sorted({
+    Decimal("0"), _QUALITY_MIN_VOLUME_USD, _CONVICTION_MIN_VOLUME_USD, RISK_ACTIVE_VOLUME,
+    RISK_MODERATE_VOLUME, RISK_GOOD_VOLUME, RISK_ELITE_VOLUME,
+}))
+_TRADES_7D_TIERS = (0, 1, 3)
+
+
+@functools.lru_cache(maxsize=256)
+def _quality_decision(
+    trades_tier: int,
+    volume_tier: int,
+    big_avg_trade: bool,
+    busy_day: bool,
+    trades_3d_ok: bool,
+    trades_7d_tier: int,
+    days_active_ok: bool,
+) -> Tuple[int, Tuple[str, ...], Optional[str]]:
+    """Risk score, failed qualification criteria and dual path for a stats tier.
+
+    Returns:
+        (risk_score, failed_criteria, qualification_path)
+    """
+    total_trades = _TRADE_TIERS[trades_tier]
+    total_volume = _VOLUME_TIERS[volume_tier]
+    avg_trade_size = _CONVICTION_MIN_AVG_TRADE_USD if big_avg_trade else Decimal("0")
+    days_active = 1 if days_active_ok else 0
+
+    risk_score = calculate_risk_score(
+        total_trades=total_trades,
+        avg_trade_size=avg_trade_size,
+        total_volume=total_volume,
+        trades_per_day=RISK_ELITE_TRADES_PER_DAY if busy_day else Decimal("0"),
+        last_active=None,  # Not available in DetectedWhale
+    )
+
+    # Stage 2: Binary Qualification Gate
+    # Activity-based criteria (NOT ROI-based - no settlement data available)
+    #
+    # Qualified if ALL of:
+    # - total_trades >= 10 (lifetime)
+    # - trades_last_3_days >= 3
+    # - total_volume >= $500
+    # - days_active >= 1 (at least one trading day)
+    qualification_criteria = {
+        "min_10_trades": total_trades >= _QUALITY_MIN_TRADES,
+        "min_3_trades_3days": trades_3d_ok,
+        "min_500_volume": total_volume >= _QUALITY_MIN_VOLUME_USD,
+        "min_1_day_active": days_active_ok,
+    }
+    failed_criteria = tuple(k for k, v in qualification_criteria.items() if not v)
+
+    qualification_path = _qualification_path(
+        total_trades=total_trades,
+        total_volume_usd=total_volume,
+        avg_trade_size_usd=avg_trade_size,
+        trades_last_7_days=_TRADES_7D_TIERS[trades_7d_tier],
+        days_active=days_active,
+        risk_score=risk_score,
+    )
+    return risk_score, failed_criteria, qualification_path
+
+
+@functools.lru_cache(maxsize=65536)
+def _address_key(address: str) -> str:
+    """Lowercased, interned wallet address used as the key of all whale maps."""
+    return sys.intern(address.lower())
+
+
+def _trade_day(timestamp: float) -> str:
+    """Local calendar day of a trade, as used for days_active."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+
+
+class _TraderWindow:
+    """Time-ordered trades of one trader with running aggregates.
+
+    Volume (int USD units) and per-day counts are updated on append/evict,
+    so stats for a whale no longer need a full pass over its trade history.
+    Evicted records are returned to the trade record pool.
+
+    Timestamps are mirrored in a parallel array so window cut-offs are found
+    by binary search; evicted entries are skipped via a start offset and
+    compacted once they make up half of the storage.
+    """
 
+    def __init__(self) -> None:
+        self._records: List[Optional[TradeRecord]] = []
+        self._timestamps = array("d")
+        self._start = 0
+        self.volume_units = 0
+        self.day_counts: Dict[str, int] = {}
 
-@dataclass
+    def __len__(self) -> int:
+        return len(self._records) - self._start
+
+    @property
+    def trades(self) -> List[TradeRecord]:
+        """Copies of the trades currently in the window, oldest first.
+
+        The stored records go back to the pool on eviction and get reused,
+        so callers never see the live objects.
+        """
+        return [copy.copy(trade) for trade in self._records[self._start:]]
+
+    def append(self, trade: TradeRecord) -> None:
+        """Add trade, keeping the window ordered by timestamp."""
+        timestamps = self._timestamps
+        if not len(self) or timestamps[-1] <= trade.timestamp:
+            self._records.append(trade)
+            timestamps.append(trade.timestamp)
+        else:
+            # Late trade: slot it in after any equal timestamps
+            i = bisect.bisect_right(timestamps, trade.timestamp, lo=self._start)
+            self._records.insert(i, trade)
+            timestamps.insert(i, trade.timestamp)
+        self.volume_units += trade.size_units
+        day = _trade_day(trade.timestamp)
+        self.day_counts[day] = self.day_counts.get(day, 0) + 1
+
+    def evict(self, cutoff: float) -> None:
+        """Drop trades with timestamp <= cutoff from the head."""
+        end = bisect.bisect_right(self._timestamps, cutoff, lo=self._start)
+        for i in range(self._start, end):
+            old = self._records[i]
+            self._records[i] = None
+            self.volume_units -= old.size_units
+            day = _trade_day(old.timestamp)
+            left = self.day_counts[day] - 1
+            if left:
+                self.day_counts[day] = left
+            else:
+                del self.day_counts[day]
+            _trade_pool.append(old)
+        self._start = end
+        if end and end * 2 >= len(self._records):
+            del self._records[:end]
+            del self._timestamps[:end]
+            self._start = 0
+
+    def last_timestamp(self) -> Optional[float]:
+        """Timestamp of the newest trade, or None for an empty window."""
+        return self._timestamps[-1] if len(self) else None
+
+    def count_since(self, cutoff: float) -> int:
+        """Number of trades with timestamp > cutoff."""
+        return len(self._records) - bisect.bisect_right(
+            self._timestamps, cutoff, lo=self._start
+        )
+
+
+@dataclass(slots=True)
 class DetectedWhale:
     """Represents a whale identified by the detector.
 
@@ -175,7 +432,7 @@ class DetectedWhale:
     days_active_30d: int = 0  # Active days in last 30 days
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DetectionConfig:
     """Configuration for whale detection.
 
@@ -193,6 +450,39 @@ class DetectionConfig:
     quality_volume: Decimal = Decimal("1000")
 
 
+# Upsert of one whale; executed with a list of params for batched writes
+_WHALE_UPSERT_SQL = """
+    INSERT INTO whales (
+        wallet_address, total_trades,
+        total_volume_usd, avg_trade_size_usd, last_active_at, risk_score,
+        qualification_status, trades_last_3_days, trades_last_7_days,
+        days_active_7d, days_active_30d,
+        source_new, updated_at, notes
+    ) VALUES (
+        :wallet_address, :total_trades,
+        :total_volume, :avg_trade_size, NOW(), :risk_score,
+        :qualification_status, :trades_last_3_days, :trades_last_7_days,
+        :days_active_7d, :days_active_30d,
+        'auto_detected', NOW(), :notes
+    )
+    ON CONFLICT (wallet_address) DO UPDATE SET
+        total_trades = EXCLUDED.total_trades,
+        total_volume_usd = EXCLUDED.total_volume_usd,
+        avg_trade_size_usd = EXCLUDED.avg_trade_size_usd,
+        risk_score = EXCLUDED.risk_score,
+        qualification_status = EXCLUDED.qualification_status,
+        trades_last_3_days = EXCLUDED.trades_last_3_days,
+        trades_last_7_days = EXCLUDED.trades_last_7_days,
+        days_active_7d = EXCLUDED.days_active_7d,
+        days_active_30d = EXCLUDED.days_active_30d,
+        last_active_at = NOW(),
+        updated_at = NOW(),
+        notes = EXCLUDED.notes
+    WHERE whales.copy_status != 'excluded'
+"""
+_WHALE_UPSERT_STMT = text(_WHALE_UPSERT_SQL)
+
+
 class WhaleDetector:
     """Automatic Whale Detector from trade streams.
 
@@ -206,6 +496,13 @@ class WhaleDetector:
     """
 
     DETECTION_WINDOW_HOURS = 72  # Must be >= 3 days for trades_last_3_days calculation
+    WHALE_FLUSH_INTERVAL_SECONDS = 1.0  # Batched whales upsert cadence
+    TRADE_FLUSH_INTERVAL_SECONDS = 0.5  # Batched whale_trades insert cadence
+    TRADE_FLUSH_MAX_ROWS = 500  # Flush early once this many trades are queued
+    TRADE_RETRY_MAX_ROWS = 10_000  # Cap on validated trades kept while the DB is down
+    IDLE_TRADER_SWEEP_SECONDS = 86400  # Windows of active traders are evicted per trade
+    CALLBACK_CONCURRENCY = 16  # Max concurrent on_whale_detected calls per Polymarket poll
+    AGGREGATE_CACHE_TTL_SECONDS = 3600  # Re-process unchanged API whales at least hourly
 
     def __init__(
         self,
@@ -233,8 +530,11 @@ class WhaleDetector:
         self.on_whale_detected = on_whale_detected
         self.on_whale_updated = on_whale_updated
 
-        self._trades: Dict[str, List[TradeRecord]] = defaultdict(list)
+        self._trades: Dict[str, _TraderWindow] = defaultdict(_TraderWindow)
         self._detected_whales: Dict[str, DetectedWhale] = {}
+        # Secondary indices over _detected_whales, kept in sync at write time
+        self._quality_whales: Set[str] = set()
+        self._daily_active: Set[str] = set()
         self._known_whales: Set[str] = set()
         self._running = False
         self._task: Optional[asyncio.Task] = None
@@ -244,8 +544,21 @@ class WhaleDetector:
         self._category_backfill_task: Optional[asyncio.Task] = None  # Category backfill
         self._engine = None
         self._Session = None
-        self._lock = asyncio.Lock()
         self._whale_trades_repo: Optional[WhaleTradesRepo] = None
+        # Dirty whales by address (latest state wins), upserted in batches by _whale_flush_loop
+        self._pending_whales: Dict[str, DetectedWhale] = {}
+        self._whale_flush_task: Optional[asyncio.Task] = None
+        # Stream/poll trades for whale_trades, written in batches by _trade_flush_loop
+        self._pending_trades: List[Dict[str, Any]] = []
+        self._trade_flush_event = asyncio.Event()
+        self._trade_flush_task: Optional[asyncio.Task] = None
+        # Validated trades whose write failed on a connection error, retried first
+        self._retry_trades: List[Dict[str, Any]] = []
+        # One DB thread keeps sync SQLAlchemy calls off the event loop and ordered
+        self._db_executor: Optional[ThreadPoolExecutor] = None
+        # Previous poll's aggregated stats; unchanged addresses are skipped
+        self._last_agg: Dict[str, AggregatedTraderStats] = {}
+        self._last_agg_expires_at = 0.0
 
         logger.info(
             "whale_detector_initialized",
@@ -257,7 +570,15 @@ class WhaleDetector:
     def set_database(self, database_url: str) -> None:
         """Set database URL and initialize connection."""
         self.database_url = database_url
-        self._engine = create_engine(
+        self._engine = self._create_engine(database_url)
+        self._Session = sessionmaker(bind=self._engine)
+        self._whale_trades_repo = WhaleTradesRepo(session_factory=self._Session)
+        logger.info("whale_detector_database_configured")
+        logger.info("whale_trades_repo_initialized")
+
+    def _create_engine(self, database_url: str):
+        """Create the detector's SQLAlchemy engine."""
+        return create_engine(
             database_url,
             pool_pre_ping=True,
             pool_recycle=1800,
@@ -266,25 +587,13 @@ class WhaleDetector:
                 "options": "-c statement_timeout=30000",
             },
         )
-        self._Session = sessionmaker(bind=self._engine)
-        self._whale_trades_repo = WhaleTradesRepo(session_factory=self._Session)
-        logger.info("whale_detector_database_configured")
-        logger.info("whale_trades_repo_initialized")
 
     async def _ensure_database(self) -> None:
         """Ensure database connection is available."""
         if not self.database_url:
             return
         if not self._engine:
-            self._engine = create_engine(
-                self.database_url,
-                pool_pre_ping=True,
-                pool_recycle=1800,
-                connect_args={
-                    "connect_timeout": 10,
-                    "options": "-c statement_timeout=30000",
-                },
-            )
+            self._engine = self._create_engine(self.database_url)
             self._Session = sessionmaker(bind=self._engine)
         if not self._whale_trades_repo:
             self._whale_trades_repo = WhaleTradesRepo(session_factory=self._Session)
@@ -297,6 +606,8 @@ class WhaleDetector:
 
         self._running = True
         self._task = asyncio.create_task(self._cleanup_loop())
+        self._whale_flush_task = asyncio.create_task(self._whale_flush_loop())
+        self._trade_flush_task = asyncio.create_task(self._trade_flush_loop())
 
         await self._load_known_whales()
 
@@ -379,6 +690,26 @@ class WhaleDetector:
             except asyncio.CancelledError:
                 pass
 
+        if self._whale_flush_task:
+            self._whale_flush_task.cancel()
+            try:
+                await self._whale_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._whale_flush_task = None
+        if self._trade_flush_task:
+            self._trade_flush_task.cancel()
+            try:
+                await self._trade_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._trade_flush_task = None
+        await self._flush_pending_whales()
+        await self._flush_pending_trades()
+        if self._db_executor:
+            self._db_executor.shutdown(wait=False)
+            self._db_executor = None
+
         logger.info(
             "whale_detector_stopped",
             detected_whales=len(self._detected_whales),
@@ -388,7 +719,7 @@ class WhaleDetector:
         """Background cleanup of old trade data."""
         while self._running:
             try:
-                await asyncio.sleep(3600)
+                await asyncio.sleep(self.IDLE_TRADER_SWEEP_SECONDS)
                 await self._cleanup_old_trades()
             except asyncio.CancelledError:
                 break
@@ -404,15 +735,19 @@ class WhaleDetector:
         pass  # Disabled: now runs via cron
 
     async def _cleanup_old_trades(self) -> None:
-        """Remove trades older than detection window."""
+        """Drop traders with no trade inside the detection window.
+
+        Active traders evict expired trades on every update
+        (_update_whale_stats), so only fully idle windows are left here.
+        """
         cutoff = time.time() - (self.DETECTION_WINDOW_HOURS * 3600)
-        async with self._lock:
-            for trader in list(self._trades.keys()):
-                self._trades[trader] = [
-                    t for t in self._trades[trader] if t.timestamp > cutoff
-                ]
-                if not self._trades[trader]:
-                    del self._trades[trader]
+        # No await inside: process_trade cannot interleave, so no lock is needed
+        for trader in list(self._trades.keys()):
+            window = self._trades[trader]
+            last = window.last_timestamp()
+            if last is None or last <= cutoff:
+                window.evict(cutoff)
+                del self._trades[trader]
 
     async def _load_known_whales(self) -> None:
         """Load known whales from database."""
@@ -420,6 +755,25 @@ class WhaleDetector:
         if not self._Session:
             return
 
+        try:
+            addresses = await self._run_db(self._query_known_whale_addresses)
+        except Exception as e:
+            logger.error("load_known_whales_failed", error=str(e))
+            return
+
+        for address in addresses:
+            self._known_whales.add(address)
+            self._store_whale(
+                DetectedWhale(
+                    wallet_address=address,
+                    first_seen=time.time(),
+                )
+            )
+
+        logger.info("known_whales_loaded", count=len(self._known_whales))
+
+    def _query_known_whale_addresses(self) -> List[str]:
+        """Lowercased addresses of whales with a qualified status (blocking)."""
         session = self._Session()
         try:
             # TRD-419: Use qualification_status instead of deprecated is_active
@@ -428,21 +782,20 @@ class WhaleDetector:
                 SELECT wallet_address FROM whales
                 WHERE qualification_status IN ('qualified', 'ranked', 'tracked')
             """)
-            result = session.execute(query)
-            for row in result:
-                self._known_whales.add(row[0].lower())
-                self._detected_whales[row[0].lower()] = DetectedWhale(
-                    wallet_address=row[0].lower(),
-                    first_seen=time.time(),
-                )
-
-            logger.info("known_whales_loaded", count=len(self._known_whales))
-
-        except Exception as e:
-            logger.error("load_known_whales_failed", error=str(e))
+            return [_address_key(row[0]) for row in session.execute(query)]
         finally:
             session.close()
 
+    async def _run_db(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking DB call on the detector's DB thread."""
+        if self._db_executor is None:
+            self._db_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="whale_detector_db"
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._db_executor, functools.partial(fn, *args, **kwargs)
+        )
+
     async def _bootstrap_existing_whales(self) -> None:
         """TRD-420 Bootstrap: Fetch initial history for existing whales.
         
@@ -524,10 +877,10 @@ class WhaleDetector:
         if size_usd < self.config.min_trade_size:
             return None
 
-        trader = trader.lower()
+        trader = _address_key(trader)
         timestamp = timestamp or time.time()
 
-        trade = TradeRecord(
+        trade = _new_trade_record(
             trader=trader,
             market_id=market_id,
             side=side,
@@ -536,89 +889,99 @@ class WhaleDetector:
             timestamp=timestamp,
         )
 
-        async with self._lock:
-            self._trades[trader].append(trade)
+        became_quality = False
+        # The in-memory update below never yields to the event loop
+        # (_save_whale_to_db only enqueues), so it needs no lock
+        self._trades[trader].append(trade)
 
-            whale = self._detected_whales.get(trader)
-            is_new = False
+        whale = self._detected_whales.get(trader)
+        is_new = False
 
-            if not whale:
-                whale = DetectedWhale(
-                    wallet_address=trader,
-                    first_seen=timestamp,
-                )
-                self._detected_whales[trader] = whale
-                is_new = True
+        if not whale:
+            whale = DetectedWhale(
+                wallet_address=trader,
+                first_seen=timestamp,
+            )
+            self._store_whale(whale)
+            is_new = True
 
-            self._update_whale_stats(whale)
+        self._update_whale_stats(whale)
 
-            # Stage 2: Save ALL discovered whales (not just quality ones)
-            # This ensures we track all candidates for qualification
-            await self._save_whale_to_db(whale)
-            
-            # Also save trade to whale_trades (ingestion pipeline fix)
-            # This is the canonical source for whale_trades
-            market_title = await get_market_title(market_id)
-            await self.save_trade_to_db(
-                trader=trader,
-                market_id=market_id,
-                side=side,
-                size_usd=size_usd,
-                price=price,
-                timestamp=timestamp,
-                market_title=market_title,
-                source="BACKFILL",
-            )
-            
-            if is_new:
-                self._known_whales.add(trader)
+        # Stage 2: Save ALL discovered whales (not just quality ones)
+        # This ensures we track all candidates for qualification
+        await self._save_whale_to_db(whale)
+
+        if is_new:
+            self._known_whales.add(trader)
 
+        # Update when quality status changes
+        elif whale.daily_trades >= self.config.daily_trade_threshold:
+            old_quality = whale.is_quality
+            old_status = whale.status
+            self._evaluate_quality(whale)
+
+            # Log status change
+            if whale.status != old_status:
                 logger.info(
-                    "new_whale_discovered",
+                    "whale_status_changed",
                     address=trader[:10],
-                    daily_trades=whale.daily_trades,
-                    total_trades=whale.total_trades,
-                    total_volume=str(whale.total_volume),
-                    status=whale.status,
+                    old_status=old_status,
+                    new_status=whale.status,
+                    risk_score=whale.risk_score,
                 )
 
-                if self.on_whale_detected:
-                    try:
-                        await self.on_whale_detected(whale)
-                    except Exception as e:
-                        logger.error("whale_detected_callback_failed", error=str(e))
+            became_quality = whale.is_quality and not old_quality
 
-                return whale
+        # Callbacks get a snapshot so later trades don't change it under them
+        whale_snapshot = dataclasses.replace(whale)
 
-            # Update when quality status changes
-            if whale.daily_trades >= self.config.daily_trade_threshold:
-                old_quality = whale.is_quality
-                old_status = whale.status
-                self._evaluate_quality(whale)
+        # Network/DB work and user callbacks run after the in-memory update
 
-                # Log status change
-                if whale.status != old_status:
-                    logger.info(
-                        "whale_status_changed",
-                        address=trader[:10],
-                        old_status=old_status,
-                        new_status=whale.status,
-                        risk_score=whale.risk_score,
-                    )
+        # Also save trade to whale_trades (ingestion pipeline fix)
+        # This is the canonical source for whale_trades
+        market_title = await get_market_title(market_id)
+        self._queue_trade(
+            trader=trader,
+            market_id=market_id,
+            side=side,
+            size_usd=size_usd,
+            price=price,
+            timestamp=timestamp,
+            market_title=market_title,
+            source="BACKFILL",
+        )
 
-                if whale.is_quality and not old_quality:
-                    logger.info(
-                        "whale_became_quality",
-                        address=trader[:10],
-                        win_rate=str(whale.win_rate),
-                        risk_score=whale.risk_score,
-                    )
+        if is_new:
+            logger.info(
+                "new_whale_discovered",
+                address=trader[:10],
+                daily_trades=whale_snapshot.daily_trades,
+                total_trades=whale_snapshot.total_trades,
+                total_volume=str(whale_snapshot.total_volume),
+                status=whale_snapshot.status,
+            )
+
+            if self.on_whale_detected:
+                try:
+                    await self.on_whale_detected(whale_snapshot)
+                except Exception as e:
+                    logger.error("whale_detected_callback_failed", error=str(e))
+
+            return whale
 
-                    if self.on_whale_updated:
-                        try:
-                            await self.on_whale_updated(whale)
-                        except Exception as e:
-                            logger.error("whale_updated_callback_failed", error=str(e))
+        if became_quality:
+            logger.info(
+                "whale_became_quality",
+                address=trader[:10],
+                win_rate=str(whale_snapshot.win_rate),
+                risk_score=whale_snapshot.risk_score,
+            )
+
+            if self.on_whale_updated:
+                try:
+                    await self.on_whale_updated(whale_snapshot)
+                except Exception as e:
+                    logger.error("whale_updated_callback_failed", error=str(e))
 
         return None
 
@@ -628,41 +991,30 @@ class WhaleDetector:
         Args:
             whale: Whale to update
         """
-        cutoff_24h = time.time() - 86400
-        cutoff_72h = time.time() - (3 * 86400)  # 3 days for qualification
-        cutoff_7d = time.time() - (7 * 86400)  # 7 days for dual-path qualification
-        cutoff_window = time.time() - (self.DETECTION_WINDOW_HOURS * 3600)
-
-        recent_trades = [
-            t for t in self._trades[whale.wallet_address] if t.timestamp > cutoff_24h
-        ]
-        trades_last_3_days = [
-            t for t in self._trades[whale.wallet_address] if t.timestamp > cutoff_72h
-        ]
-        trades_last_7_days = [
-            t for t in self._trades[whale.wallet_address] if t.timestamp > cutoff_7d
-        ]
-        all_trades = [
-            t for t in self._trades[whale.wallet_address] if t.timestamp > cutoff_window
-        ]
-
-        whale.total_trades = len(all_trades)
-        whale.daily_trades = len(recent_trades)
-        whale.trades_last_3_days = len(trades_last_3_days)
-        whale.trades_last_7_days = len(trades_last_7_days)
+        now = time.time()
+        cutoff_24h = now - 86400
+        cutoff_72h = now - (3 * 86400)  # 3 days for qualification
+        cutoff_7d = now - (7 * 86400)  # 7 days for dual-path qualification
+        cutoff_window = now - (self.DETECTION_WINDOW_HOURS * 3600)
+
+        # Expired trades leave the running aggregates; the rest is the window
+        window = self._trades[whale.wallet_address]
+        window.evict(cutoff_window)
+
+        whale.total_trades = len(window)
+        whale.daily_trades = window.count_since(cutoff_24h)
+        if whale.daily_trades >= self.config.daily_trade_threshold:
+            self._daily_active.add(whale.wallet_address)
+        else:
+            self._daily_active.discard(whale.wallet_address)
+        whale.trades_last_3_days = window.count_since(cutoff_72h)
+        whale.trades_last_7_days = window.count_since(cutoff_7d)
         
-        # Calculate days_active (unique trading days)
-        if all_trades:
-            trading_days = set()
-            for t in all_trades:
-                # Convert timestamp to date string
-                day = datetime.fromtimestamp(t.timestamp).strftime("%Y-%m-%d")
-                trading_days.add(day)
-            whale.days_active = len(trading_days)
-
-        if all_trades:
-            whale.total_volume = sum(t.size_usd for t in all_trades)
-            whale.avg_trade_size = whale.total_volume / Decimal(len(all_trades))
+        # days_active = unique trading days in the window
+        if window:
+            whale.days_active = len(window.day_counts)
+            whale.total_volume = _from_usd_units(window.volume_units)
+            whale.avg_trade_size = whale.total_volume / Decimal(len(window))
 
         # win_count/loss_count/win_rate REMOVED (ARC-503) - API does not provide is_winner
         # These fields are now deprecated and always 0
@@ -686,67 +1038,60 @@ class WhaleDetector:
         """
         # Use unified risk_score calculation from WhaleTracker
         # SOURCE-OF-TRUTH: ensures consistency across all modules
-        whale.risk_score = calculate_risk_score(
-            total_trades=whale.total_trades,
-            avg_trade_size=whale.avg_trade_size,
-            total_volume=whale.total_volume,
-            trades_per_day=Decimal(whale.daily_trades),
-            last_active=None,  # Not available in DetectedWhale
+        whale.risk_score, failed_criteria, whale.qualification_path = _quality_decision(
+            trades_tier=bisect.bisect_right(_TRADE_TIERS, whale.total_trades) - 1,
+            volume_tier=bisect.bisect_right(_VOLUME_TIERS, whale.total_volume) - 1,
+            big_avg_trade=whale.avg_trade_size >= _CONVICTION_MIN_AVG_TRADE_USD,
+            busy_day=whale.daily_trades >= RISK_ELITE_TRADES_PER_DAY,
+            trades_3d_ok=whale.trades_last_3_days >= 3,
+            trades_7d_tier=bisect.bisect_right(_TRADES_7D_TIERS, whale.trades_last_7_days) - 1,
+            days_active_ok=whale.days_active >= 1,
         )
-        
-        # Stage 2: Binary Qualification Gate
-        # Activity-based criteria (NOT ROI-based - no settlement data available)
-        #
-        # Qualified if ALL of:
-        # - total_trades >= 10 (lifetime)
-        # - trades_last_3_days >= 3
-        # - total_volume >= $500
-        # - days_active >= 1 (at least one trading day)
-        
-        qualification_criteria = {
-            "min_10_trades": whale.total_trades >= 10,
-            "min_3_trades_3days": whale.trades_last_3_days >= 3,
-            "min_500_volume": whale.total_volume >= Decimal("500"),
-            "min_1_day_active": whale.days_active >= 1,
-        }
-        
-        is_qualified = all(qualification_criteria.values())
-        
+
         # Set status based on qualification (TRD-419: use qualification_status)
-        if is_qualified:
+        if not failed_criteria:
             whale.qualification_status = "qualified"
             whale.status = "qualified"  # Legacy - for backward compat
             whale.is_quality = True
-            logger.debug(
-                "whale_qualified",
-                address=whale.wallet_address[:10],
-                total_trades=whale.total_trades,
-                trades_last_3_days=whale.trades_last_3_days,
-                total_volume=str(whale.total_volume),
-                days_active=whale.days_active,
-            )
+            self._quality_whales.add(whale.wallet_address)
+            if _std_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "whale_qualified",
+                    address=whale.wallet_address[:10],
+                    total_trades=whale.total_trades,
+                    trades_last_3_days=whale.trades_last_3_days,
+                    total_volume=str(whale.total_volume),
+                    days_active=whale.days_active,
+                )
         else:
             whale.qualification_status = "discovered"
             whale.status = "discovered"  # Legacy - for backward compat
             whale.is_quality = False
+            self._quality_whales.discard(whale.wallet_address)
             # Log why not qualified (for debugging)
-            failed_criteria = [k for k, v in qualification_criteria.items() if not v]
-            if failed_criteria:
+            if _std_logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "whale_not_qualified",
                     address=whale.wallet_address[:10],
-                    failed_criteria=failed_criteria,
+                    failed_criteria=list(failed_criteria),
                 )
 
-        # Calculate dual-path qualification
-        whale.qualification_path = self._calculate_qualification_path(
-            total_trades=whale.total_trades,
-            total_volume_usd=whale.total_volume,
-            avg_trade_size_usd=whale.avg_trade_size,
-            trades_last_7_days=whale.trades_last_7_days,
-            days_active=whale.days_active,
-            risk_score=whale.risk_score,
-        )
+    def _store_whale(self, whale: DetectedWhale) -> None:
+        """Put whale into _detected_whales and re-sync the secondary indices.
+
+        Args:
+            whale: Whale to store (replaces any previous entry for the address)
+        """
+        address = whale.wallet_address
+        self._detected_whales[address] = whale
+        if whale.is_quality:
+            self._quality_whales.add(address)
+        else:
+            self._quality_whales.discard(address)
+        if whale.daily_trades >= self.config.daily_trade_threshold:
+            self._daily_active.add(address)
+        else:
+            self._daily_active.discard(address)
 
     def _calculate_qualification_path(
         self,
@@ -778,38 +1123,31 @@ class WhaleDetector:
         Returns:
             'ACTIVE', 'CONVICTION', or None if not qualified
         """
-        active_path = (
-            total_trades >= 10 and
-            total_volume_usd >= Decimal("500") and
-            trades_last_7_days >= 3 and
-            days_active >= 1 and
-            risk_score <= 6
+        path = _qualification_path(
+            total_trades=total_trades,
+            total_volume_usd=total_volume_usd,
+            avg_trade_size_usd=avg_trade_size_usd,
+            trades_last_7_days=trades_last_7_days,
+            days_active=days_active,
+            risk_score=risk_score,
         )
-        
-        conviction_path = (
-            total_volume_usd >= Decimal("10000") and
-            avg_trade_size_usd >= Decimal("2000") and
-            trades_last_7_days >= 1 and
-            days_active >= 1 and
-            risk_score <= 6
-        )
-        
-        if active_path:
+
+        if not _std_logger.isEnabledFor(logging.DEBUG):
+            return path
+        if path == "ACTIVE":
             logger.debug(
                 "whale_qualified_active_path",
                 total_trades=total_trades,
                 total_volume_usd=str(total_volume_usd),
                 trades_last_7_days=trades_last_7_days,
             )
-            return "ACTIVE"
-        elif conviction_path:
+        elif path == "CONVICTION":
             logger.debug(
                 "whale_qualified_conviction_path",
                 total_volume_usd=str(total_volume_usd),
                 avg_trade_size_usd=str(avg_trade_size_usd),
                 trades_last_7_days=trades_last_7_days,
             )
-            return "CONVICTION"
         else:
             logger.debug(
                 "whale_not_qualified_dual_path",
@@ -818,7 +1156,7 @@ class WhaleDetector:
                 trades_last_7_days=trades_last_7_days,
                 risk_score=risk_score,
             )
-            return None
+        return path
 
     async def refresh_qualification(self) -> int:
         """Refresh qualification for all whales based on recent trades.
@@ -1003,90 +1341,178 @@ class WhaleDetector:
         return updated
 
     async def _save_whale_to_db(self, whale: DetectedWhale) -> None:
-        """Save whale to database.
+        """Mark whale dirty for the next batched upsert into whales.
+
+        Repeated saves of one whale before a flush collapse into one row.
 
         Args:
             whale: Whale to save
         """
+        self._pending_whales[whale.wallet_address] = whale
+
+    async def _whale_flush_loop(self) -> None:
+        """Periodically write queued whales in one batch."""
+        while True:
+            await asyncio.sleep(self.WHALE_FLUSH_INTERVAL_SECONDS)
+            try:
+                await self._flush_pending_whales()
+            except Exception as e:
+                logger.error("whale_flush_failed", error=str(e))
+
+    def _queue_trade(
+        self,
+        trader: str,
+        market_id: str,
+        side: str,
+        size_usd: Decimal,
+        price: Decimal,
+        timestamp: Optional[float] = None,
+        tx_hash: Optional[str] = None,
+        market_title: Optional[str] = None,
+        source: str = "BACKFILL",
+        outcome: Optional[str] = None,
+        token_id: Optional[str] = None,
+    ) -> None:
+        """Queue a trade for the next batched whale_trades insert.
+
+        Same arguments as save_trade_to_db, for callers that don't need
+        the per-trade saved/duplicate result.
+        """
+        self._pending_trades.append({
+            "wallet_address": trader,
+            "market_id": market_id,
+            "side": side,
+            "size_usd": size_usd,
+            "price": price,
+            "outcome": outcome,
+            "market_title": market_title,
+            "market_category": None,  # TRD-408: filled by background task
+            "tx_hash": tx_hash,
+            "source": source,
+            "traded_at": datetime.fromtimestamp(timestamp) if timestamp else None,
+            "token_id": token_id,
+        })
+        if len(self._pending_trades) >= self.TRADE_FLUSH_MAX_ROWS:
+            self._trade_flush_event.set()
+
+    async def _trade_flush_loop(self) -> None:
+        """Write queued trades every TRADE_FLUSH_INTERVAL_SECONDS or when the buffer fills."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._trade_flush_event.wait(), self.TRADE_FLUSH_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._trade_flush_event.clear()
+            try:
+                await self._flush_pending_trades()
+            except Exception as e:
+                logger.error("trade_flush_failed", error=str(e))
+
+    async def _flush_pending_trades(self) -> None:
+        """Insert every queued trade in one WhaleTradesRepo batch."""
+        if not self._pending_trades and not self._retry_trades:
+            return
+        batch, self._pending_trades = self._pending_trades, []
+
         await self._ensure_database()
-        if not self._Session:
-            logger.warning("save_whale_db_no_session", address=whale.wallet_address[:10])
+        if not self._whale_trades_repo:
+            logger.warning("save_trade_no_repo", count=len(batch))
             return
-        
-        logger.info(
-            "save_whale_to_db",
-            address=whale.wallet_address[:10],
-            total_trades=whale.total_trades,
-            status=whale.status,
-        )
 
-        session = self._Session()
+        retry, self._retry_trades = self._retry_trades, []
+        unsaved = await self._run_db(self._write_trade_rows, batch, retry)
+        if unsaved:
+            # Keep validated rows for the next flush while the database is down
+            self._retry_trades[:0] = unsaved
+            dropped = len(self._retry_trades) - self.TRADE_RETRY_MAX_ROWS
+            if dropped > 0:
+                del self._retry_trades[:dropped]
+                logger.error("save_trade_rows_dropped", dropped=dropped)
+
+    def _write_trade_rows(
+        self, batch: List[Dict[str, Any]], retry: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Validate batch and write it after retry rows (DB thread).
+
+        Returns:
+            Validated rows that were not written because of a connection error
+        """
+        repo = self._whale_trades_repo
+        counts, prepared = repo.prepare_trades(batch)
+        rows = retry + prepared
         try:
-            # TRD-419: Use new activity-based fields
-            # qualification_status replaces status
-            # days_active_7d replaces days_active (for 7-day window logic)
-            # ARC-501: Removed deprecated columns (total_profit_usd, qualification_path, status, days_active)
-            # BUG-607: Add WHERE to prevent overwriting excluded whales
-            query = text("""
-                INSERT INTO whales (
-                    wallet_address, total_trades,
-                    total_volume_usd, avg_trade_size_usd, last_active_at, risk_score,
-                    qualification_status, trades_last_3_days, trades_last_7_days,
-                    days_active_7d, days_active_30d,
-                    source_new, updated_at, notes
-                ) VALUES (
-                    :wallet_address, :total_trades,
-                    :total_volume, :avg_trade_size, NOW(), :risk_score,
-                    :qualification_status, :trades_last_3_days, :trades_last_7_days,
-                    :days_active_7d, :days_active_30d,
-                    'auto_detected', NOW(), :notes
-                )
-                ON CONFLICT (wallet_address) DO UPDATE SET
-                    total_trades = EXCLUDED.total_trades,
-                    total_volume_usd = EXCLUDED.total_volume_usd,
-                    avg_trade_size_usd = EXCLUDED.avg_trade_size_usd,
-                    risk_score = EXCLUDED.risk_score,
-                    qualification_status = EXCLUDED.qualification_status,
-                    trades_last_3_days = EXCLUDED.trades_last_3_days,
-                    trades_last_7_days = EXCLUDED.trades_last_7_days,
-                    days_active_7d = EXCLUDED.days_active_7d,
-                    days_active_30d = EXCLUDED.days_active_30d,
-                    last_active_at = NOW(),
-                    updated_at = NOW(),
-                    notes = EXCLUDED.notes
-                WHERE whales.copy_status != 'excluded'
-            """)
-            session.execute(
-                query,
-                {
-                    "wallet_address": whale.wallet_address,
-                    "total_trades": whale.total_trades,
-                    "total_volume": float(whale.total_volume),
-                    "avg_trade_size": float(whale.avg_trade_size),
-                    "risk_score": whale.risk_score,
-                    "qualification_status": whale.qualification_status,
-                    "trades_last_3_days": whale.trades_last_3_days,
-                    "trades_last_7_days": whale.trades_last_7_days,
-                    "days_active_7d": whale.days_active_7d,
-                    "days_active_30d": whale.days_active_30d,
-                    "notes": whale.name if whale.name else None,
-                },
+            counts.update(repo.save_prepared_trades(rows))
+            logger.debug("trade_batch_flushed", **counts)
+        except Exception as e:
+            requeued = is_connection_error(e)
+            logger.error(
+                "save_trade_batch_failed", error=str(e), count=len(rows), requeued=requeued
             )
-            session.commit()
-            logger.debug("whale_saved_to_db", address=whale.wallet_address[:10])
+            if requeued:
+                return rows
+        return []
 
+    async def _flush_pending_whales(self) -> None:
+        """Upsert every queued whale (latest state per address) in one transaction."""
+        if not self._pending_whales:
+            return
+        batch, self._pending_whales = self._pending_whales, {}
+
+        await self._ensure_database()
+        if not self._engine:
+            logger.warning("save_whale_db_no_session", count=len(batch))
+            return
+
+        params = [
+            {
+                "wallet_address": whale.wallet_address,
+                "total_trades": whale.total_trades,
+                "total_volume": float(whale.total_volume),
+                "avg_trade_size": float(whale.avg_trade_size),
+                "risk_score": whale.risk_score,
+                "qualification_status": whale.qualification_status,
+                "trades_last_3_days": whale.trades_last_3_days,
+                "trades_last_7_days": whale.trades_last_7_days,
+                "days_active_7d": whale.days_active_7d,
+                "days_active_30d": whale.days_active_30d,
+                "notes": whale.name if whale.name else None,
+            }
+            for whale in batch.values()
+        ]
+
+        try:
+            await self._run_db(self._upsert_whales, params)
+            logger.debug("whales_saved_to_db", count=len(params))
         except Exception as e:
-            logger.error("whale_save_failed", error=str(e))
-            session.rollback()
-        finally:
-            session.close()
+            logger.error("whale_save_failed", error=str(e), count=len(params))
+            # Retry with the next flush; whales re-queued since then are newer
+            for address, whale in batch.items():
+                self._pending_whales.setdefault(address, whale)
+            return
 
-        # TRD-420: Fetch initial history for new whales
+        # TRD-420: Fetch initial history for new whales once their row exists
         # Check if initial_history_fetched is FALSE or NULL
-        # Use asyncio.create_task to NOT block the main loop
-        if self.polymarket_client:
-            # Check if we need to fetch initial history (non-blocking check)
-            asyncio.create_task(self._fetch_initial_history(whale.wallet_address))
+        # Use asyncio.create_task to NOT block the main loop; the final flush
+        # from stop() must not start new fetches
+        if self.polymarket_client and self._running:
+            for address in batch:
+                asyncio.create_task(self._fetch_initial_history(address))
+
+    def _upsert_whales(self, params: List[Dict[str, Any]]) -> None:
+        """Execute the batched whales upsert in one transaction (blocking).
+
+        A pooled connection is checked out per flush so pool_pre_ping and
+        pool_recycle replace connections dropped by a restart or idle timeout.
+        """
+        # TRD-419: Use new activity-based fields
+        # qualification_status replaces status
+        # days_active_7d replaces days_active (for 7-day window logic)
+        # ARC-501: Removed deprecated columns (total_profit_usd, qualification_path, status, days_active)
+        # BUG-607: Add WHERE to prevent overwriting excluded whales
+        with self._engine.begin() as conn:
+            conn.execute(_WHALE_UPSERT_STMT, params)
 
     async def _fetch_initial_history(self, address: str) -> None:
         """
@@ -1139,13 +1565,9 @@ class WhaleDetector:
                 return
 
             # Aggregate in memory
-            total_volume = Decimal("0")
             trade_count = len(trades)
-            timestamps = []
-
-            for t in trades:
-                total_volume += t.size_usd
-                timestamps.append(t.timestamp)
+            timestamps = [t.timestamp for t in trades]
+            total_volume = Decimal(str(sum(t.size_usd for t in trades)))
 
             # Calculate unique trading days
             unique_days = len(set(
@@ -1260,7 +1682,8 @@ class WhaleDetector:
             traded_at = datetime.fromtimestamp(timestamp)
         
         try:
-            result = self._whale_trades_repo.save_trade(
+            result = await self._run_db(
+                self._whale_trades_repo.save_trade,
                 wallet_address=trader,
                 market_id=market_id,
                 side=side,
@@ -1298,7 +1721,7 @@ class WhaleDetector:
         Returns:
             List of quality DetectedWhale objects
         """
-        return [w for w in self._detected_whales.values() if w.is_quality]
+        return [self._detected_whales[a] for a in self._quality_whales]
 
     def get_whale(self, address: str) -> Optional[DetectedWhale]:
         """Get whale by address.
@@ -1309,7 +1732,7 @@ class WhaleDetector:
         Returns:
             DetectedWhale or None if not found
         """
-        return self._detected_whales.get(address.lower())
+        return self._detected_whales.get(_address_key(address))
 
     def is_known_whale(self, address: str) -> bool:
         """Check if address is a known whale.
@@ -1320,7 +1743,7 @@ class WhaleDetector:
         Returns:
             True if known whale
         """
-        return address.lower() in self._known_whales
+        return _address_key(address) in self._known_whales
 
     def set_polymarket_client(self, client: PolymarketDataClient) -> None:
         """Set Polymarket Data client for real-time whale detection.
@@ -1509,13 +1932,13 @@ class WhaleDetector:
                     # Convert outcome to Yes/No format using helper function
                     normalized_outcome = convert_outcome_to_yes_no(trade.outcome)
                     
-                    # Save trade to database with tx_hash for deduplication
-                    await self.save_trade_to_db(
+                    # Queue trade for the batched insert (dedup by tx_hash)
+                    self._queue_trade(
                         trader=trade.trader,
                         market_id=market_id,
                         side=side,
-                        size_usd=trade.size_usd,
-                        price=trade.price,
+                        size_usd=Decimal(str(trade.size_usd)),
+                        price=Decimal(str(trade.price)),
                         timestamp=float(trade.timestamp),
                         tx_hash=trade.tx_hash,
                         market_title=trade.market_title,
@@ -1533,21 +1956,44 @@ class WhaleDetector:
                 min_size_usd=min_size,
             )
 
-            new_whales = 0
+            if time.time() >= self._last_agg_expires_at:
+                # Time-based fields (3d/7d activity, risk) need a periodic refresh
+                self._last_agg = {}
+                self._last_agg_expires_at = time.time() + self.AGGREGATE_CACHE_TTL_SECONDS
+
+            # Only addresses whose stats changed since the last poll are processed
+            changed: Dict[str, Tuple[str, AggregatedTraderStats]] = {}
             for address, stats in aggregated.items():
-                logger.info(
-                    "whale_check",
-                    address=address[:10],
-                    total_trades=stats.total_trades,
-                    min_required=self.config.min_trades_for_quality,
-                    is_known=address.lower() in self._known_whales,
-                )
-                if stats.total_trades < self.config.min_trades_for_quality:
-                    logger.info("whale_skipped_min_trades", address=address[:10], total_trades=stats.total_trades)
-                    continue
+                prev = self._last_agg.get(address)
+                if (
+                    prev is None
+                    or prev.total_trades != stats.total_trades
+                    or prev.last_seen != stats.last_seen
+                ):
+                    changed[_address_key(address)] = (address, stats)
+            unchanged = len(aggregated) - len(changed)
+            # Unknown addresses in one set difference instead of a lookup per address
+            new_addresses = changed.keys() - self._known_whales
 
+            new_whales = 0
+            detected: List[DetectedWhale] = []
+            log_info = _std_logger.isEnabledFor(logging.INFO)
+            for key, (address, stats) in changed.items():
                 # Check if whale is already known
-                is_known = address.lower() in self._known_whales
+                is_known = key not in new_addresses
+
+                if log_info:
+                    logger.info(
+                        "whale_check",
+                        address=address[:10],
+                        total_trades=stats.total_trades,
+                        min_required=self.config.min_trades_for_quality,
+                        is_known=is_known,
+                    )
+                if stats.total_trades < self.config.min_trades_for_quality:
+                    if log_info:
+                        logger.info("whale_skipped_min_trades", address=address[:10], total_trades=stats.total_trades)
+                    continue
                 
                 # Calculate trades_last_3_days, trades_last_7_days and days_active
                 # NOTE: Polymarket API only returns recent trades, not full history
@@ -1580,18 +2026,19 @@ class WhaleDetector:
                 
                 # Calculate volume: use API value if available, otherwise estimate from avg_size * trades
                 # This handles cases where API returns 0 volume but has avg_trade_size
+                avg_trade_size = Decimal(str(stats.avg_trade_size_usd))
                 if stats.total_volume_usd > 0:
-                    total_volume = stats.total_volume_usd
+                    total_volume = Decimal(str(stats.total_volume_usd))
                 else:
                     # Estimate volume from avg_trade_size and total_trades
-                    total_volume = stats.avg_trade_size_usd * Decimal(stats.total_trades)
+                    total_volume = avg_trade_size * Decimal(stats.total_trades)
                 
                 whale = DetectedWhale(
-                    wallet_address=address.lower(),
+                    wallet_address=key,
                     first_seen=stats.last_seen if stats.last_seen else time.time(),
                     total_trades=stats.total_trades,
                     total_volume=total_volume,
-                    avg_trade_size=stats.avg_trade_size_usd,
+                    avg_trade_size=avg_trade_size,
                     trades_last_3_days=trades_last_3_days,
                     trades_last_7_days=trades_last_7_days,
                     days_active=days_active,
@@ -1620,11 +2067,11 @@ class WhaleDetector:
                 )
 
                 if stats.total_trades >= self.config.min_trades_for_quality:
-                    self._detected_whales[address.lower()] = whale
+                    self._store_whale(whale)
                     await self._save_whale_to_db(whale)
                     
                     if not is_known:
-                        self._known_whales.add(address.lower())
+                        self._known_whales.add(key)
                         new_whales += 1
                         logger.info(
                             "polymarket_new_whale",
@@ -1647,24 +2094,46 @@ class WhaleDetector:
                         volume_usd=str(stats.total_volume_usd),
                     )
 
-                    if self.on_whale_detected:
-                        try:
-                            await self.on_whale_detected(whale)
-                        except Exception as e:
-                            logger.error(
-                                "polymarket_whale_callback_failed", error=str(e)
-                            )
+                    detected.append(whale)
+
+            self._last_agg = aggregated
+
+            if self.on_whale_detected and detected:
+                await self._notify_whales_detected(detected)
 
             if new_whales > 0:
                 logger.info(
                     "polymarket_fetch_complete",
                     new_whales=new_whales,
                     total_traders=len(aggregated),
+                    unchanged=unchanged,
                 )
 
         except Exception as e:
             logger.error("polymarket_fetch_failed", error=str(e))
 
+    async def _notify_whales_detected(self, whales: List[DetectedWhale]) -> None:
+        """Run on_whale_detected for a poll's whales concurrently.
+
+        At most CALLBACK_CONCURRENCY callbacks run at once; a failing
+        callback is logged and does not cancel the others.
+
+        Args:
+            whales: Whales stored by the poll
+        """
+        semaphore = asyncio.Semaphore(self.CALLBACK_CONCURRENCY)
+
+        async def notify(whale: DetectedWhale) -> None:
+            async with semaphore:
+                try:
+                    await self.on_whale_detected(whale)
+                except Exception as e:
+                    logger.error("polymarket_whale_callback_failed", error=str(e))
+
+        async with asyncio.TaskGroup() as tg:
+            for whale in whales:
+                tg.create_task(notify(whale))
+
     async def _fetch_paper_whale_trades(self) -> None:
         """Fetch recent trades for whales with copy_status='paper'.
 
@@ -1774,7 +2243,7 @@ class WhaleDetector:
 
                 # Save trade to db with dedup by tx_hash
                 saved = await self.save_trade_to_db(
-                    trader=trade.trader.lower(),
+                    trader=_address_key(trade.trader),
                     market_id=trade.condition_id,
                     side="buy" if trade.side.upper() == "BUY" else "sell",
                     size_usd=size_usd,
@@ -1910,7 +2379,7 @@ class WhaleDetector:
 
                 # Save trade to db with dedup by tx_hash
                 saved = await self.save_trade_to_db(
-                    trader=trade.trader.lower(),
+                    trader=_address_key(trade.trader),
                     market_id=trade.condition_id,
                     side="buy" if trade.side.upper() == "BUY" else "sell",
                     size_usd=size_usd,
@@ -1949,11 +2418,7 @@ class WhaleDetector:
             return []
 
         await self._fetch_polymarket_whales()
-        return [
-            w
-            for w in self._detected_whales.values()
-            if w.daily_trades >= self.config.daily_trade_threshold
-        ]
+        return [self._detected_whales[a] for a in self._daily_active]
 
     def get_stats(self) -> Dict[str, Any]:
         """Get detector statistics.
@@ -680,8 +680,9 @@ class WhaleTracker:
                     WhaleStats(
                         wallet_address=row[0],
                         total_trades=row[1],
-                        total_volume_usd=Decimal(str(row[2])),
-                        avg_trade_size_usd=Decimal(str(row[3])),
+                        # DECIMAL(20,8) NOT NULL: the driver already returns Decimal
+                        total_volume_usd=row[2],
+                        avg_trade_size_usd=row[3],
                         last_active_at=row[4],
                         risk_score=row[5],
                         # New activity-based fields from DB
@@ -904,6 +905,22 @@ class WhaleTracker:
             await self._http_session.close()
 
 
+# Volume / activity cut-offs used by calculate_risk_score (WhaleDetector builds
+# its memoized quality tiers from the same constants)
+RISK_ELITE_VOLUME = Decimal("500000")
+RISK_GOOD_VOLUME = Decimal("100000")
+RISK_MODERATE_VOLUME = Decimal("50000")
+RISK_ACTIVE_VOLUME = Decimal("10000")
+RISK_ELITE_TRADES_PER_DAY = Decimal("5")
+RISK_ELITE_TOP_TRADES = 1000
+RISK_ELITE_TRADES = 500
+RISK_GOOD_TOP_TRADES = 500
+RISK_GOOD_TRADES = 200
+RISK_MODERATE_TRADES = 50
+RISK_ACTIVE_TRADES = 20
+RISK_LOW_TRADES = 10
+
+
 # Standalone function for external use (e.g., testing)
 def calculate_risk_score(
     total_trades: int,
@@ -940,24 +957,24 @@ def calculate_risk_score(
     score = 5
 
     # Elite: High volume and consistent activity
-    if total_volume >= Decimal("500000") and total_trades >= 500:
-        if total_trades >= 1000 and trades_per_day >= Decimal("5"):
+    if total_volume >= RISK_ELITE_VOLUME and total_trades >= RISK_ELITE_TRADES:
+        if total_trades >= RISK_ELITE_TOP_TRADES and trades_per_day >= RISK_ELITE_TRADES_PER_DAY:
             score = 1
         else:
             score = 2
     # Good: Moderate volume
-    elif total_volume >= Decimal("100000") and total_trades >= 200:
-        if total_trades >= 500:
+    elif total_volume >= RISK_GOOD_VOLUME and total_trades >= RISK_GOOD_TRADES:
+        if total_trades >= RISK_GOOD_TOP_TRADES:
             score = 3
         else:
             score = 4
     # Moderate: Some activity
-    elif total_volume >= Decimal("50000") and total_trades >= 50:
+    elif total_volume >= RISK_MODERATE_VOLUME and total_trades >= RISK_MODERATE_TRADES:
         score = 5
-    elif total_volume >= Decimal("10000") and total_trades >= 20:
+    elif total_volume >= RISK_ACTIVE_VOLUME and total_trades >= RISK_ACTIVE_TRADES:
         score = 6
     # Low activity
-    elif total_trades >= 10:
+    elif total_trades >= RISK_LOW_TRADES:
         score = 7
     else:
         score = 8
@@ -6,6 +6,7 @@ Usage:
 """
 
 import asyncio
+import io
 import os
 import sys
 import time
@@ -273,10 +274,6 @@ async def main():
                 last_seen_result = conn.execute(text("SELECT MAX(traded_at) FROM whale_trades"))
                 last_seen = last_seen_result.scalar()
                 
-                # Whale_id coverage
-                has_whale_id_result = conn.execute(text("SELECT COUNT(*) FROM whale_trades WHERE whale_id IS NOT NULL"))
-                has_whale_id = has_whale_id_result.scalar() or 0
-                
                 # Unique traders
                 unique_traders_result = conn.execute(text("SELECT COUNT(DISTINCT wallet_address) FROM whale_trades WHERE wallet_address IS NOT NULL"))
                 unique_traders = unique_traders_result.scalar() or 0
@@ -284,7 +281,6 @@ async def main():
                 return {
                     "total_count": total_count,
                     "last_seen": last_seen,
-                    "has_whale_id": has_whale_id,
                     "unique_traders": unique_traders,
                 }
         except Exception as e:
@@ -304,21 +300,25 @@ async def main():
             if cycle % 6 == 0:
                 trades_stats = get_whale_trades_stats()
 
-            print(f"[{time.time():.0f}] Stats:")
-            print(f"   Total tracked: {stats['total_tracked']}")
-            print(f"   Quality whales: {stats['quality_whales']}")
+            # Build the whole stats block first and flush it with a single write
+            buf = io.StringIO()
+            buf.write(f"[{time.time():.0f}] Stats:\n")
+            buf.write(f"   Total tracked: {stats['total_tracked']}\n")
+            buf.write(f"   Quality whales: {stats['quality_whales']}\n")
             
             # Ingestion metrics
             if trades_stats:
-                print(f"   INGEST: whale_trades={trades_stats.get('total_count', '?')}, last_seen={trades_stats.get('last_seen', 'none')}, unique_traders={trades_stats.get('unique_traders', '?')}")
+                buf.write(f"   INGEST: whale_trades={trades_stats.get('total_count', '?')}, last_seen={trades_stats.get('last_seen', 'none')}, unique_traders={trades_stats.get('unique_traders', '?')}\n")
             
             if quality:
-                print("   🐋 Quality Whales:")
+                buf.write("   🐋 Quality Whales:\n")
                 for whale in quality[:5]:
-                    print(
-                        f"      {whale.wallet_address[:10]}... | WR: {whale.win_rate * 100:.1f}% | Vol: ${whale.total_volume:.0f}"
+                    buf.write(
+                        f"      {whale.wallet_address[:10]}... | WR: {whale.win_rate * 100:.1f}% | Vol: ${whale.total_volume:.0f}\n"
                     )
-            print()
+            buf.write("\n")
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
 
     except KeyboardInterrupt:
         print("\n\n🛑 Stopping...")
@@ -329,4 +329,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop is a soft dependency (Linux/macOS): faster loop when available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -7,8 +7,13 @@ This file is automatically loaded by pytest and configures the test environment.
 
 import sys
 import os
+import tempfile
 from pathlib import Path
 
+# src.monitoring.logger attaches file handlers at import; keep test runs
+# from writing into the repository's logs/ directory
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="polymarket-bot-logs-"))
+
 # Add src directory to Python path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
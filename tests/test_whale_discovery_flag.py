@@ -15,6 +15,8 @@ def _make_detector():
     det.database_url = None                       # отключает category_backfill_loop
     # заглушки корутин, вызываемых в start()
     det._cleanup_loop = AsyncMock()
+    det._whale_flush_loop = AsyncMock()
+    det._trade_flush_loop = AsyncMock()
     det._load_known_whales = AsyncMock()
     det._bootstrap_existing_whales = AsyncMock()
     det.start_polymarket_polling = AsyncMock()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for PolymarketDataClient trade parsing and aggregation."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.research.polymarket_data_client import (
+    PolymarketDataClient,
+    PolymarketDataError,
+    _read_json,
+)
+
+
+def _item(trader, side="BUY", size=100, price=0.5, usdc_size=None, timestamp=1700000000):
+    item = {
+        "proxyWallet": trader,
+        "side": side,
+        "size": size,
+        "price": price,
+        "timestamp": timestamp,
+        "conditionId": "0xcond",
+    }
+    if usdc_size is not None:
+        item["usdcSize"] = usdc_size
+    return item
+
+
+@pytest.fixture
+def client():
+    return PolymarketDataClient(api_key="test")
+
+
+def test_parse_trades_uses_floats(client):
+    """Sizes are parsed as floats; size_usd falls back to size * price."""
+    trades = client._parse_trades([_item("0xABC", size=10, price=0.25)])
+
+    assert len(trades) == 1
+    assert trades[0].trader == "0xabc"
+    assert trades[0].size_usd == pytest.approx(2.5)
+    assert isinstance(trades[0].price, float)
+
+
+def test_parse_trades_filters_by_min_size(client):
+    """Trades below min_size_usd are dropped during parsing."""
+    data = [_item("0xa", usdc_size=50), _item("0xb", usdc_size="1500.5")]
+
+    trades = client._parse_trades(data, min_size_usd=Decimal("1000"))
+
+    assert [t.trader for t in trades] == ["0xb"]
+    assert trades[0].size_usd == pytest.approx(1500.5)
+
+
+def test_parse_trades_skips_missing_trader(client):
+    """Items without proxyWallet are ignored."""
+    assert client._parse_trades([_item("")]) == []
+
+
+@pytest.mark.asyncio
+async def test_aggregate_by_address(client):
+    """Aggregation sums volume, counts sides and tracks last_seen."""
+    trades = client._parse_trades([
+        _item("0xa", side="BUY", usdc_size=1000, timestamp=10),
+        _item("0xa", side="SELL", usdc_size=3000, timestamp=30),
+        _item("0xb", side="BUY", usdc_size=2000, timestamp=20),
+    ])
+    client.fetch_recent_trades = AsyncMock(return_value=trades)
+
+    aggregated = await client.aggregate_by_address(limit=3)
+
+    a = aggregated["0xa"]
+    assert a.total_trades == 2
+    assert a.total_volume_usd == pytest.approx(4000.0)
+    assert a.avg_trade_size_usd == pytest.approx(2000.0)
+    assert (a.buy_count, a.sell_count) == (1, 1)
+    assert a.last_seen == 30
+    assert aggregated["0xb"].total_trades == 1
+
+
+@pytest.mark.asyncio
+async def test_read_json_rejects_invalid_body():
+    """Malformed bodies surface as PolymarketDataError."""
+    pytest.importorskip("orjson")
+    response = AsyncMock()
+    response.read.return_value = b"<html>rate limited</html>"
+
+    with pytest.raises(PolymarketDataError):
+        await _read_json(response)
+
+    response.read.return_value = b'[{"proxyWallet": "0xa"}]'
+    assert await _read_json(response) == [{"proxyWallet": "0xa"}]
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_trader_trades_bounds_concurrency(client):
+    """Fetches run concurrently up to the cap; failures are dropped."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch(address, limit=100):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if address == "0xbad":
+            raise PolymarketDataError("API error: 500")
+        return client._parse_trades([_item(address)])
+
+    client.fetch_trader_trades = fake_fetch
+    addresses = [f"0x{i}" for i in range(6)] + ["0xBAD", "0x0"]
+
+    result = await client.fetch_many_trader_trades(addresses, max_concurrency=3)
+
+    assert peak == 3
+    assert sorted(result) == sorted(f"0x{i}" for i in range(6))
+    assert result["0x1"][0].trader == "0x1"
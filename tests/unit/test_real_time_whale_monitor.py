@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for RealTimeWhaleMonitor signal handling."""
+
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.research.real_time_whale_monitor import (
+    RealTimeWhaleMonitor,
+    WhaleSignalBuffer,
+    WhaleTradeSignal,
+    _TokenBucket,
+)
+
+
+def _repo():
+    """WhaleTradesRepo mock whose validation passes rows through unchanged."""
+    repo = MagicMock()
+    repo.prepare_trades.side_effect = lambda trades: ({}, list(trades))
+    return repo
+
+
+def _ws_trade(size="1000", price="0.5", **extra):
+    data = {
+        "event_type": "trade",
+        "asset_id": "token-1",
+        "market": "0xmarket",
+        "size": size,
+        "price": price,
+        "side": "BUY",
+        "address": "0xwhale",
+    }
+    data.update(extra)
+    return data
+
+
+@pytest.fixture
+def monitor():
+    return RealTimeWhaleMonitor(min_trade_size=Decimal("100"))
+
+
+@pytest.mark.asyncio
+async def test_ws_trades_are_handled_by_single_consumer(monitor):
+    """Whale trades are queued and handled by the consumer task in order."""
+    handled = []
+    monitor._handle_whale_signal = AsyncMock(side_effect=handled.append)
+    consumer = asyncio.create_task(monitor._signal_consumer())
+
+    monitor._process_single_message(_ws_trade(size="1000"), 100.0)
+    monitor._process_single_message(_ws_trade(size="10"), 100.0)  # below min size
+    monitor._process_single_message(_ws_trade(size="2000", side="SELL"), 100.0)
+    await asyncio.wait_for(monitor._signal_queue.join(), timeout=1)
+    consumer.cancel()
+
+    assert [s.side for s in handled] == ["buy", "sell"]
+    assert handled[0].size_usd == Decimal("500.0")
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_signals(monitor):
+    """Signals still queued at stop() are handled and their rows flushed."""
+    handled = []
+
+    async def handle(signal):
+        handled.append(signal)
+        await monitor._save_whale_signal_to_db(signal)
+
+    monitor._handle_whale_signal = handle
+    monitor._whale_trades_repo = _repo()
+    monitor._consumer_task = asyncio.create_task(monitor._signal_consumer())
+    for _ in range(3):
+        monitor._process_single_message(_ws_trade(), 100.0)
+
+    with patch(
+        "src.research.real_time_whale_monitor.get_market_category",
+        AsyncMock(return_value="sports"),
+    ):
+        await monitor.stop()
+
+    assert len(handled) == 3
+    assert len(monitor._whale_trades_repo.save_prepared_trades.call_args.args[0]) == 3
+    assert monitor._signal_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_signals(monitor):
+    """Signals beyond the queue capacity are counted and dropped."""
+    monitor._signal_queue = asyncio.Queue(maxsize=1)
+
+    monitor._process_single_message(_ws_trade(), 100.0)
+    monitor._process_single_message(_ws_trade(), 100.0)
+
+    assert monitor._signal_queue.qsize() == 1
+    assert monitor._get_stats()["signals_dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_saved_signals_are_flushed_as_one_batch(monitor):
+    """Buffered whale_trades rows are written with a single repo batch."""
+    monitor._whale_trades_repo = _repo()
+    monitor._process_single_message(_ws_trade(size="1000"), 100.0)
+    monitor._process_single_message(_ws_trade(size="2000"), 100.0)
+    with patch(
+        "src.research.real_time_whale_monitor.get_market_category",
+        AsyncMock(return_value="sports"),
+    ):
+        while not monitor._signal_queue.empty():
+            await monitor._save_whale_signal_to_db(monitor._signal_queue.get_nowait())
+
+    await monitor._flush_db_buffer()
+
+    monitor._whale_trades_repo.save_prepared_trades.assert_called_once()
+    batch = monitor._whale_trades_repo.save_prepared_trades.call_args.args[0]
+    assert [row["size_usd"] for row in batch] == [Decimal("500.0"), Decimal("1000.0")]
+    assert monitor._db_buffer == []
+
+
+@pytest.mark.asyncio
+async def test_connection_error_keeps_validated_rows(monitor):
+    """Rows are retried after a connection error without being validated again."""
+    repo = monitor._whale_trades_repo = _repo()
+    repo.save_prepared_trades.side_effect = [OperationalError("insert", {}, None), {}]
+    monitor._db_buffer = [{"market_id": "a"}]
+
+    await monitor._flush_db_buffer()
+    monitor._db_buffer.append({"market_id": "b"})
+    await monitor._flush_db_buffer()
+
+    assert [c.args[0] for c in repo.prepare_trades.call_args_list] == [
+        [{"market_id": "a"}], [{"market_id": "b"}],
+    ]
+    assert repo.save_prepared_trades.call_args.args[0] == [{"market_id": "a"}, {"market_id": "b"}]
+    assert monitor._db_retry_rows == []
+
+
+@pytest.mark.asyncio
+async def test_data_error_is_not_requeued(monitor):
+    """Errors other than lost connections are logged, not retried forever."""
+    repo = monitor._whale_trades_repo = _repo()
+    repo.save_prepared_trades.side_effect = ValueError("bad row")
+    monitor._db_buffer = [{"market_id": "a"}]
+
+    await monitor._flush_db_buffer()
+
+    assert monitor._db_retry_rows == []
+
+
+def test_stats_are_updated_before_queueing(monitor):
+    """Detection stats and delay alerts do not wait for the consumer task."""
+    monitor._process_single_message(_ws_trade(), 100.0)
+
+    assert monitor.stats.trades_detected == 1
+    assert monitor._signal_queue.qsize() == 1
+
+
+def test_rolling_delay_stats_follow_window(monitor):
+    """avg/max delay cover only the last DELAY_WINDOW_SIZE signals."""
+    monitor.DELAY_WINDOW_SIZE = 3
+    monitor._delays = deque(maxlen=3)
+    for delay in (50.0, 10.0, 20.0, 30.0):
+        monitor._fast_path(SimpleNamespace(delay_ms=delay, signal_id="s"))
+
+    assert monitor.stats.avg_delay_ms == pytest.approx(20.0)
+    assert monitor.stats.max_delay_ms == 30.0
+
+
+def test_trader_filter_cache_is_reset_on_tracking_change(monitor):
+    """Memoized trader decisions follow add/remove_tracked_whale."""
+    monitor.add_tracked_whale("0xWhale")
+    assert monitor._accept_trader("0xwhale") is True
+    assert monitor._accept_trader("0xother") is False
+
+    monitor.remove_tracked_whale("0xWhale")
+    monitor.add_tracked_whale("0xOther")
+    assert monitor._accept_trader("0xwhale") is False
+    assert monitor._accept_trader("0xother") is True
+
+
+@pytest.mark.asyncio
+async def test_signal_buffer_dedups_within_window():
+    """Same market/trader/side inside the window is rejected, later accepted."""
+    buffer = WhaleSignalBuffer(dedup_window_seconds=5.0)
+
+    def signal(ts):
+        return WhaleTradeSignal(
+            signal_id="s", market_id="m", side="buy", size_usd=Decimal("1"),
+            price=Decimal("0.5"), trader_address="0xwhale", timestamp=ts,
+        )
+
+    assert await buffer.add(signal(100.0)) is True
+    assert await buffer.add(signal(103.0)) is False
+    assert await buffer.add(signal(106.0)) is True
+
+
+@pytest.mark.asyncio
+async def test_signal_buffer_get_recent_uses_time_window():
+    """get_recent returns only signals newer than the cutoff, oldest first."""
+    buffer = WhaleSignalBuffer(dedup_window_seconds=5.0)
+    now = time.time()
+    for market, age in (("a", 120.0), ("b", 10.0), ("c", 30.0)):
+        await buffer.add(WhaleTradeSignal(
+            signal_id=market, market_id=market, side="buy", size_usd=Decimal("1"),
+            price=Decimal("0.5"), trader_address="0xwhale", timestamp=now - age,
+        ))
+
+    recent = await buffer.get_recent(seconds=60.0)
+
+    assert [s.market_id for s in recent] == ["c", "b"]
+
+
+@pytest.mark.asyncio
+async def test_detected_trade_logs_are_rate_limited(monitor):
+    """Once the log bucket is empty, detections are only counted."""
+    monitor._log_limiter = _TokenBucket(rate=0, burst=1)
+    monitor._save_whale_signal_to_db = AsyncMock()
+    monitor._process_single_message(_ws_trade(), 100.0)
+    monitor._process_single_message(_ws_trade(), 100.0)
+
+    with patch(
+        "src.research.real_time_whale_monitor.get_market_title",
+        AsyncMock(return_value="title"),
+    ):
+        while not monitor._signal_queue.empty():
+            await monitor._handle_whale_signal(monitor._signal_queue.get_nowait())
+
+    assert monitor._log_suppressed == 1
+
+
+def test_tracked_whales_cannot_be_mutated_behind_the_cache(monitor):
+    """tracked_whales is a read-only view; replacing it resets cached decisions."""
+    monitor.add_tracked_whale("0xWhale")
+    assert monitor._accept_trader("0xother") is False
+
+    with pytest.raises(AttributeError):
+        monitor.tracked_whales.add("0xother")
+    monitor.tracked_whales = {"0xother"}
+
+    assert monitor._accept_trader("0xother") is True
+    assert monitor._accept_trader("0xwhale") is False
+
+
+def test_trader_filter_accepts_mixed_case_addresses(monitor):
+    """Raw (checksummed) addresses from the feed match lowercase tracking."""
+    monitor.add_tracked_whale("0xWhale")
+
+    assert monitor._accept_trader("0xWHALE") is True
+    assert "0xWHALE" in monitor._trader_cache
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for TelegramAlerts message batching."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.monitoring.telegram_alerts import (
+    BATCH_SEPARATOR,
+    TELEGRAM_MAX_MESSAGE_LENGTH,
+    TIME_ONLY_FORMAT,
+    TelegramAlerts,
+    _now_str,
+)
+
+
+@pytest.fixture
+def alerts():
+    """TelegramAlerts with a mocked transport."""
+    instance = TelegramAlerts(bot_token="token", chat_id="chat")
+    instance._send_raw = AsyncMock(return_value=True)
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_burst_is_sent_as_one_message(alerts):
+    """Messages queued within the batch window share one POST."""
+    for i in range(3):
+        assert await alerts._send_message(f"alert {i}") is True
+
+    await alerts.close()
+
+    alerts._send_raw.assert_awaited_once_with(
+        BATCH_SEPARATOR.join(["alert 0", "alert 1", "alert 2"]), "Markdown"
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_resent_one_by_one(alerts):
+    """A rejected merged message falls back to individual sends."""
+    joined = BATCH_SEPARATOR.join(["good", "*bad"])
+    alerts._send_raw.side_effect = lambda text, parse_mode: text != joined
+    await alerts._send_message("good")
+    await alerts._send_message("*bad")
+
+    await alerts.close()
+
+    assert [c.args[0] for c in alerts._send_raw.await_args_list] == [joined, "good", "*bad"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_alerts_are_not_queued():
+    """Without credentials nothing is queued."""
+    instance = TelegramAlerts(bot_token="token", chat_id="chat")
+    instance.enabled = False
+
+    assert await instance._send_message("alert") is False
+    assert instance._queue.empty()
+
+
+def test_coalesce_keeps_parse_modes_apart():
+    """Only consecutive messages with the same parse mode are grouped."""
+    batch = [("a", "Markdown"), ("b", "Markdown"), ("c", "HTML"), ("d", "Markdown")]
+
+    assert TelegramAlerts._coalesce_groups(batch) == [
+        (["a", "b"], "Markdown"),
+        (["c"], "HTML"),
+        (["d"], "Markdown"),
+    ]
+
+
+def test_coalesce_respects_length_limit():
+    """Joined text never exceeds Telegram's message length limit."""
+    long_message = "x" * (TELEGRAM_MAX_MESSAGE_LENGTH - 2)
+    batch = [(long_message, "Markdown"), ("tail", "Markdown")]
+
+    assert TelegramAlerts._coalesce_groups(batch) == [
+        ([long_message], "Markdown"),
+        (["tail"], "Markdown"),
+    ]
+
+    fitting = "x" * (TELEGRAM_MAX_MESSAGE_LENGTH - len(BATCH_SEPARATOR) - len("tail"))
+    assert TelegramAlerts._coalesce_groups([(fitting, "Markdown"), ("tail", "Markdown")]) == [
+        ([fitting, "tail"], "Markdown"),
+    ]
+
+
+def test_now_str_matches_strftime():
+    """Cached timestamp renders the same as a direct strftime."""
+    with patch("src.monitoring.telegram_alerts.time.time", return_value=1767236645.5):
+        assert _now_str() == "2026-01-01 03:04 UTC"
+        assert _now_str(TIME_ONLY_FORMAT) == "03:04:05 UTC"
@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for WhaleDetector in-memory trade stats."""
+
+import asyncio
+import bisect
+import dataclasses
+import logging
+import threading
+import time
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.research.polymarket_data_client import AggregatedTraderStats
+from src.research.whale_tracker import calculate_risk_score
+from src.research.whale_detector import (
+    DetectedWhale,
+    DetectionConfig,
+    TradeRecord,
+    WhaleDetector,
+    _TRADE_TIERS,
+    _VOLUME_TIERS,
+    _TraderWindow,
+    _address_key,
+    _new_trade_record,
+    _quality_decision,
+    _trade_pool,
+)
+
+TRADER = "0xwhale"
+
+
+def _repo():
+    """WhaleTradesRepo mock whose validation passes rows through unchanged."""
+    repo = MagicMock()
+    repo.prepare_trades.side_effect = lambda trades: ({}, list(trades))
+    repo.save_prepared_trades.return_value = {}
+    return repo
+
+
+def _trade(age_seconds, size="100"):
+    return TradeRecord(
+        trader=TRADER,
+        market_id="m",
+        side="buy",
+        size_usd=Decimal(size),
+        price=Decimal("0.5"),
+        timestamp=time.time() - age_seconds,
+    )
+
+
+@pytest.fixture
+def detector():
+    return WhaleDetector()
+
+
+def test_trader_window_keeps_time_order_and_running_volume():
+    """Late trades are slotted in order; eviction subtracts their volume."""
+    window = _TraderWindow()
+    window.append(_trade(100, "10"))
+    window.append(_trade(10, "20"))
+    window.append(_trade(50, "30"))  # arrives late
+
+    assert [t.size_usd for t in window.trades] == [Decimal("10"), Decimal("30"), Decimal("20")]
+    window.evict(time.time() - 60)
+    assert window.volume_units == 50 * 10**8
+    assert window.count_since(time.time() - 20) == 1
+
+
+def test_trader_window_trades_survive_record_reuse():
+    """A held trades list is not rewritten when its records are pooled and reused."""
+    _trade_pool.clear()
+    window = _TraderWindow()
+    window.append(_trade(3600, "10"))
+    held = window.trades
+
+    window.evict(time.time() - 60)
+    _new_trade_record(TRADER, "m2", "sell", Decimal("75"), Decimal("0.4"), time.time())
+
+    assert [(t.market_id, t.size_usd) for t in held] == [("m", Decimal("10"))]
+
+
+def test_update_whale_stats_uses_detection_window(detector):
+    """Stats count only trades inside the window and roll off expired ones."""
+    window_seconds = detector.DETECTION_WINDOW_HOURS * 3600
+    for age, size in ((window_seconds + 60, "1000"), (2 * 86400, "200"), (3600, "100"), (60, "300")):
+        detector._trades[TRADER].append(_trade(age, size))
+    whale = DetectedWhale(wallet_address=TRADER, first_seen=time.time())
+
+    detector._update_whale_stats(whale)
+
+    assert whale.total_trades == 3
+    assert whale.daily_trades == 2
+    assert whale.trades_last_3_days == 3
+    assert whale.total_volume == Decimal("600")
+    assert whale.avg_trade_size == Decimal("200")
+    assert len(detector._trades[TRADER]) == 3
+
+
+@pytest.mark.asyncio
+async def test_queued_whales_are_upserted_in_one_batch(detector):
+    """Repeated saves of a whale collapse into one row of a single executemany."""
+    engine = MagicMock()
+    conn = engine.begin.return_value.__enter__.return_value
+    detector._engine = engine
+    detector._ensure_database = AsyncMock()
+    whale = DetectedWhale(wallet_address=TRADER, first_seen=time.time())
+    other = DetectedWhale(wallet_address="0xother", first_seen=time.time())
+
+    await detector._save_whale_to_db(whale)
+    whale.total_trades = 7
+    await detector._save_whale_to_db(whale)
+    await detector._save_whale_to_db(other)
+    await detector._flush_pending_whales()
+
+    conn.execute.assert_called_once()
+    params = conn.execute.call_args.args[1]
+    assert [p["wallet_address"] for p in params] == [TRADER, "0xother"]
+    assert params[0]["total_trades"] == 7
+    assert detector._pending_whales == {}
+
+    await detector._save_whale_to_db(other)
+    await detector._flush_pending_whales()
+    # Each flush checks out a pooled connection instead of holding one open
+    assert engine.begin.call_count == 2
+    assert conn.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_whale_upsert_is_requeued(detector):
+    """A failed flush puts its whales back without overwriting newer saves."""
+    engine = MagicMock()
+    detector._engine = engine
+    detector._ensure_database = AsyncMock()
+    stale = DetectedWhale(wallet_address=TRADER, first_seen=time.time(), total_trades=1)
+    other = DetectedWhale(wallet_address="0xother", first_seen=time.time())
+    newer = dataclasses.replace(stale, total_trades=2)
+
+    async def save_during_flush(fn, *args):
+        await detector._save_whale_to_db(newer)
+        raise OperationalError("upsert", {}, None)
+
+    detector._run_db = save_during_flush
+    await detector._save_whale_to_db(stale)
+    await detector._save_whale_to_db(other)
+    await detector._flush_pending_whales()
+
+    assert detector._pending_whales == {TRADER: newer, "0xother": other}
+
+
+@pytest.mark.asyncio
+async def test_history_fetch_is_scheduled_only_while_running(detector):
+    """The final flush from stop() does not start initial-history fetches."""
+    detector._engine = MagicMock()
+    detector._ensure_database = AsyncMock()
+    detector.polymarket_client = MagicMock()
+    detector._fetch_initial_history = AsyncMock()
+
+    await detector._save_whale_to_db(DetectedWhale(wallet_address=TRADER, first_seen=time.time()))
+    await detector._flush_pending_whales()
+    await asyncio.sleep(0)
+    detector._fetch_initial_history.assert_not_called()
+
+    detector._running = True
+    await detector._save_whale_to_db(DetectedWhale(wallet_address=TRADER, first_seen=time.time()))
+    await detector._flush_pending_whales()
+    await asyncio.sleep(0)
+    detector._fetch_initial_history.assert_awaited_once_with(TRADER)
+
+
+@pytest.mark.asyncio
+async def test_whale_callbacks_get_snapshot(detector, monkeypatch):
+    """on_whale_detected gets a snapshot, awaited after the in-memory update."""
+    monkeypatch.setattr(
+        "src.research.whale_detector.get_market_title", AsyncMock(return_value=None)
+    )
+    detector.save_trade_to_db = AsyncMock(return_value=True)
+    seen = []
+
+    async def on_detected(whale):
+        seen.append((whale, len(detector._pending_whales)))
+
+    detector.on_whale_detected = on_detected
+
+    result = await detector.process_trade(
+        trader="0xWhale", market_id="m", side="buy",
+        size_usd=Decimal("100"), price=Decimal("0.5"),
+    )
+
+    snapshot, queued = seen[0]
+    assert queued == 1
+    assert snapshot is not result
+    assert snapshot.wallet_address == result.wallet_address == TRADER
+
+
+def test_quality_and_daily_indices_follow_stats(detector):
+    """The quality/daily-active sets track the whale's stats both ways."""
+    for age in range(12):
+        detector._trades[TRADER].append(_trade(60 * (age + 1)))
+    whale = DetectedWhale(wallet_address=TRADER, first_seen=time.time())
+    detector._store_whale(whale)
+
+    detector._update_whale_stats(whale)
+    assert detector.get_quality_whales() == [whale]
+    assert TRADER in detector._daily_active
+
+    detector._store_whale(DetectedWhale(wallet_address=TRADER, first_seen=time.time()))
+    assert detector.get_quality_whales() == []
+    assert TRADER not in detector._daily_active
+
+
+def test_quality_decision_is_shared_within_a_tier(detector):
+    """Whales in the same threshold tier reuse one cached decision."""
+    _quality_decision.cache_clear()
+    first = DetectedWhale(wallet_address=TRADER, first_seen=time.time(), total_trades=12,
+                          total_volume=Decimal("800"), trades_last_3_days=3,
+                          trades_last_7_days=4, days_active=1)
+    second = dataclasses.replace(first, wallet_address="0xother", total_trades=15,
+                                 total_volume=Decimal("9000"))
+
+    detector._evaluate_quality(first)
+    detector._evaluate_quality(second)
+
+    assert _quality_decision.cache_info().hits == 1
+    assert first.is_quality and second.is_quality
+    assert first.risk_score == second.risk_score == 7
+    assert first.qualification_path is second.qualification_path is None
+
+
+def test_quality_decision_matches_risk_score_at_tier_boundaries():
+    """Memoized risk scores match calculate_risk_score on both sides of each cut-off."""
+    trade_counts = sorted({n + d for n in _TRADE_TIERS for d in (-1, 0) if n + d >= 0})
+    volumes = sorted({v + d for v in _VOLUME_TIERS for d in (Decimal("-0.01"), 0) if v + d >= 0})
+    for total_trades in trade_counts:
+        for total_volume in volumes:
+            for daily_trades in (4, 5):
+                risk_score, _, _ = _quality_decision(
+                    trades_tier=bisect.bisect_right(_TRADE_TIERS, total_trades) - 1,
+                    volume_tier=bisect.bisect_right(_VOLUME_TIERS, total_volume) - 1,
+                    big_avg_trade=False,
+                    busy_day=daily_trades >= 5,
+                    trades_3d_ok=True,
+                    trades_7d_tier=0,
+                    days_active_ok=True,
+                )
+                expected = calculate_risk_score(
+                    total_trades=total_trades,
+                    avg_trade_size=Decimal("0"),
+                    total_volume=total_volume,
+                    trades_per_day=Decimal(daily_trades),
+                )
+                assert risk_score == expected, (total_trades, total_volume, daily_trades)
+
+
+def test_evicted_trade_records_are_reused():
+    """A record dropped from the window backs the next new trade."""
+    _trade_pool.clear()
+    window = _TraderWindow()
+    old = _trade(3600)
+    window.append(old)
+    window.evict(time.time() - 60)
+
+    trade = _new_trade_record(TRADER, "m2", "sell", Decimal("75"), Decimal("0.4"), time.time())
+
+    assert trade is old
+    assert (trade.market_id, trade.side, trade.size_units) == ("m2", "sell", 75 * 10**8)
+    assert not _trade_pool
+
+
+def test_trader_window_skips_then_compacts_evicted_head():
+    """Evicting a minority only moves the start offset; a majority compacts storage."""
+    window = _TraderWindow()
+    for age in (500, 400, 300, 200, 100):
+        window.append(_trade(age))
+
+    window.evict(time.time() - 450)
+    assert len(window) == 4
+    assert len(window._records) == 5
+    assert window.count_since(time.time() - 250) == 2
+
+    window.evict(time.time() - 250)
+    assert len(window) == len(window._records) == len(window._timestamps) == 2
+    assert window.volume_units == 200 * 10**8
+
+
+@pytest.mark.asyncio
+async def test_unchanged_aggregated_whales_are_skipped(detector):
+    """A second poll with the same total_trades/last_seen does no whale work."""
+    stats = AggregatedTraderStats(address=TRADER, total_trades=12, total_volume_usd=5000.0,
+                                  avg_trade_size_usd=416.0, last_seen=int(time.time()))
+    client = MagicMock()
+    client.fetch_recent_trades = AsyncMock(return_value=[])
+    client.aggregate_by_address = AsyncMock(return_value={TRADER: stats})
+    detector.polymarket_client = client
+    detector._save_whale_to_db = AsyncMock()
+
+    await detector._fetch_polymarket_whales()
+    await detector._fetch_polymarket_whales()
+    assert detector._save_whale_to_db.await_count == 1
+
+    client.aggregate_by_address.return_value = {
+        TRADER: dataclasses.replace(stats, total_trades=13)
+    }
+    await detector._fetch_polymarket_whales()
+    assert detector._save_whale_to_db.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_trade_save_runs_on_db_thread(detector):
+    """save_trade_to_db hands the blocking repo call to the detector's DB thread."""
+    threads = []
+    repo = MagicMock()
+    repo.save_trade.side_effect = lambda **kw: threads.append(threading.current_thread()) or "saved"
+    detector._whale_trades_repo = repo
+
+    saved = await detector.save_trade_to_db(
+        trader=TRADER, market_id="m", side="buy",
+        size_usd=Decimal("100"), price=Decimal("0.5"), timestamp=time.time(),
+    )
+
+    assert saved is True
+    assert threads[0] is not threading.current_thread()
+    assert threads[0].name.startswith("whale_detector_db")
+
+
+@pytest.mark.asyncio
+async def test_process_trade_update_does_not_yield(detector, monkeypatch):
+    """A concurrent task cannot observe a half-applied trade update."""
+    observed = []
+
+    async def get_title(market_id):
+        # First suspension point: the in-memory update must be complete here
+        observed.append(len(detector._trades[TRADER]))
+        await asyncio.sleep(0)
+        return None
+
+    monkeypatch.setattr("src.research.whale_detector.get_market_title", get_title)
+
+    async def probe():
+        observed.append(("probe", detector._detected_whales.get(TRADER) is not None))
+
+    task = asyncio.ensure_future(probe())
+    await detector.process_trade(
+        trader=TRADER, market_id="m", side="buy",
+        size_usd=Decimal("100"), price=Decimal("0.5"),
+    )
+    await task
+
+    assert observed[0] == 1
+    assert observed[1] == ("probe", True)
+
+
+def test_address_key_is_lowercased_and_interned(detector):
+    """Mixed-case addresses map to one shared key object."""
+    key = _address_key("0xWHALE")
+    assert key == TRADER
+    assert _address_key("0xWhale") is _address_key("".join(["0x", "whale"])) is key
+
+    detector._known_whales.add(key)
+    assert detector.is_known_whale("0xWhAlE")
+
+
+@pytest.mark.asyncio
+async def test_stream_trades_are_written_in_one_batch(detector, monkeypatch):
+    """process_trade queues whale_trades rows; a flush writes them as one batch."""
+    monkeypatch.setattr(
+        "src.research.whale_detector.get_market_title", AsyncMock(return_value="Title")
+    )
+    repo = detector._whale_trades_repo = _repo()
+
+    for _ in range(2):
+        await detector.process_trade(
+            trader=TRADER, market_id="m", side="buy",
+            size_usd=Decimal("100"), price=Decimal("0.5"),
+        )
+    repo.save_prepared_trades.assert_not_called()
+
+    await detector._flush_pending_trades()
+
+    rows = repo.save_prepared_trades.call_args.args[0]
+    assert [r["wallet_address"] for r in rows] == [TRADER, TRADER]
+    assert rows[0]["market_title"] == "Title"
+    assert detector._pending_trades == []
+
+
+@pytest.mark.asyncio
+async def test_trades_survive_connection_error(detector):
+    """Validated trades are kept after a lost connection and written next flush."""
+    repo = detector._whale_trades_repo = _repo()
+    repo.save_prepared_trades.side_effect = [OperationalError("insert", {}, None), {}]
+    detector._pending_trades = [{"market_id": "a"}]
+
+    await detector._flush_pending_trades()
+    assert detector._retry_trades == [{"market_id": "a"}]
+    await detector._flush_pending_trades()
+
+    assert repo.prepare_trades.call_count == 2
+    assert repo.save_prepared_trades.call_args.args[0] == [{"market_id": "a"}]
+    assert detector._retry_trades == []
+
+
+@pytest.mark.asyncio
+async def test_cleanup_only_drops_idle_traders(detector):
+    """The sweep removes fully expired windows and leaves active ones to per-trade eviction."""
+    window_seconds = detector.DETECTION_WINDOW_HOURS * 3600
+    detector._trades["0xidle"].append(_trade(window_seconds + 60))
+    detector._trades[TRADER].append(_trade(window_seconds + 60))
+    detector._trades[TRADER].append(_trade(60))
+
+    await detector._cleanup_old_trades()
+
+    assert "0xidle" not in detector._trades
+    assert len(detector._trades[TRADER]) == 2
+
+
+def test_quality_debug_logs_skipped_when_level_disabled(detector, monkeypatch, caplog):
+    """_evaluate_quality builds no debug events unless DEBUG is enabled."""
+    fake_logger = MagicMock()
+    monkeypatch.setattr("src.research.whale_detector.logger", fake_logger)
+    whale = DetectedWhale(wallet_address=TRADER, first_seen=time.time())
+
+    caplog.set_level(logging.INFO, logger="src.research.whale_detector")
+    detector._evaluate_quality(whale)
+    fake_logger.debug.assert_not_called()
+
+    caplog.set_level(logging.DEBUG, logger="src.research.whale_detector")
+    detector._evaluate_quality(whale)
+    fake_logger.debug.assert_called_once()
+
+
+def test_detection_config_is_immutable():
+    """DetectionConfig is frozen and hashable; whales have no per-instance __dict__."""
+    config = DetectionConfig(min_trade_size=Decimal("50"))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.min_trade_size = Decimal("10")
+    assert hash(config) == hash(DetectionConfig(min_trade_size=Decimal("50")))
+    assert not hasattr(DetectedWhale(wallet_address=TRADER, first_seen=0.0), "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_polymarket_whale_callbacks_run_concurrently(detector):
+    """Callbacks for a poll's whales overlap, and one failure doesn't stop the rest."""
+    running, peak, done = 0, 0, []
+
+    async def on_detected(whale):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if whale.wallet_address == "0x0":
+            raise RuntimeError("boom")
+        done.append(whale.wallet_address)
+
+    detector.on_whale_detected = on_detected
+    whales = [DetectedWhale(wallet_address=f"0x{i}", first_seen=0.0) for i in range(20)]
+
+    await detector._notify_whales_detected(whales)
+
+    assert peak == detector.CALLBACK_CONCURRENCY
+    assert len(done) == 19
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for WhaleTradesRepo batch writes."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from src.db.whale_trades_repo import WhaleTradesRepo
+
+MARKET_ID = "0x" + "ab" * 32
+
+
+def _trade(tx_hash=None, **extra):
+    trade = {
+        "wallet_address": "0xWhale",
+        "market_id": MARKET_ID,
+        "side": "BUY",
+        "size_usd": Decimal("100"),
+        "price": Decimal("0.5"),
+        "outcome": "Yes",
+        "market_category": "sports",
+        "tx_hash": tx_hash,
+        "source": "REALTIME",
+    }
+    trade.update(extra)
+    return trade
+
+
+def test_save_trades_single_executemany_per_statement():
+    """Valid rows go out in one executemany per INSERT variant and one commit."""
+    session = MagicMock()
+    # whales lookup, then existing tx_hash lookup
+    session.execute.side_effect = [
+        [("0xwhale", 7)],
+        [("0xexisting",)],
+        None,
+        None,
+    ]
+    repo = WhaleTradesRepo(session_factory=lambda: session)
+
+    counts = repo.save_trades([
+        _trade(),
+        _trade(tx_hash="0xnew"),
+        _trade(tx_hash="0xnew"),  # duplicate within the batch
+        _trade(tx_hash="0xexisting"),  # already in whale_trades
+        _trade(side="hold"),
+    ])
+
+    assert counts == {"saved": 2, "rejected": 1, "duplicate": 2, "burst_blocked": 0, "failed": 0}
+    plain_rows = session.execute.call_args_list[2].args[1]
+    conflict_rows = session.execute.call_args_list[3].args[1]
+    assert [r["tx_hash"] for r in plain_rows] == [None]
+    assert [r["tx_hash"] for r in conflict_rows] == ["0xnew"]
+    assert conflict_rows[0]["whale_id"] == 7
+    assert conflict_rows[0]["side"] == "buy"
+    session.commit.assert_called_once()
+    assert repo.get_stats()["saved"] == 2
+
+
+def test_rejected_batch_is_written_row_by_row_without_revalidation():
+    """A data error in the batch falls back to per-row inserts of the prepared rows."""
+    session = MagicMock()
+    bad_row = IntegrityError("insert", {}, None)
+    # whales lookup, batch insert, then one insert per row
+    session.execute.side_effect = [[], bad_row, None, bad_row, None]
+    repo = WhaleTradesRepo(session_factory=lambda: session)
+
+    counts = repo.save_trades([_trade(size_usd=Decimal("10")) for _ in range(3)])
+
+    assert counts["saved"] == 2
+    assert counts["failed"] == 1
+    assert session.commit.call_count == 2
+    # Burst counters saw each trade once, not again on the retry
+    assert len(repo._burst_counters["0xWhale:" + MARKET_ID]) == 3
+
+
+def test_connection_error_leaves_prepared_rows_for_retry():
+    """Connection errors propagate so callers can resubmit the prepared rows."""
+    session = MagicMock()
+    session.execute.side_effect = [[], OperationalError("insert", {}, None)]
+    repo = WhaleTradesRepo(session_factory=lambda: session)
+    _, prepared = repo.prepare_trades([_trade()])
+
+    with pytest.raises(OperationalError):
+        repo.save_prepared_trades(prepared)
+
+    session.execute.side_effect = [[], None]
+    assert repo.save_prepared_trades(prepared)["saved"] == 1
+
+
+def test_save_trades_copies_large_plain_batches():
+    """Large batches without tx_hash go through COPY instead of executemany."""
+    session = MagicMock()
+    session.execute.side_effect = [[]]  # whales lookup only
+    cursor = session.connection.return_value.connection.dbapi_connection.cursor.return_value
+    payloads = []
+    cursor.copy_expert.side_effect = lambda sql, buf: payloads.append(buf.getvalue())
+    repo = WhaleTradesRepo(session_factory=lambda: session)
+
+    counts = repo.save_trades([_trade(size_usd=Decimal("500")) for _ in range(201)])
+
+    assert counts["saved"] == 201
+    assert session.execute.call_count == 1
+    lines = payloads[0].splitlines()
+    assert len(lines) == 201
+    assert lines[0].startswith("\\N,0xwhale," + MARKET_ID)
+    session.commit.assert_called_once()
+
+
+def test_save_trades_copies_with_psycopg3_cursor():
+    """psycopg 3 cursors (no copy_expert) stream rows through cursor.copy."""
+    session = MagicMock()
+    session.execute.side_effect = [[]]  # whales lookup only
+    cursor = MagicMock(spec=["copy", "close"])
+    session.connection.return_value.connection.dbapi_connection.cursor.return_value = cursor
+    copy = cursor.copy.return_value.__enter__.return_value
+    repo = WhaleTradesRepo(session_factory=lambda: session)
+
+    counts = repo.save_trades([_trade(size_usd=Decimal("500")) for _ in range(201)])
+
+    assert counts["saved"] == 201
+    assert session.execute.call_count == 1
+    assert cursor.copy.call_args.args[0].startswith("COPY whale_trades (whale_id,")
+    assert copy.write_row.call_count == 201
+    assert copy.write_row.call_args.args[0][:3] == [None, "0xwhale", MARKET_ID]
+
+
+def test_whale_ids_are_cached_across_batches():
+    """A whale_id found once is not looked up again; unknown wallets are retried."""
+    session = MagicMock()
+    session.execute.return_value = [("0xwhale", 7)]
+    repo = WhaleTradesRepo(session_factory=lambda: session)
+
+    assert repo._lookup_whale_ids({"0xwhale", "0xnew"}) == {"0xwhale": 7}
+    session.execute.reset_mock()
+
+    assert repo._lookup_whale_ids({"0xwhale"}) == {"0xwhale": 7}
+    session.execute.assert_not_called()
+
+    repo._lookup_whale_ids({"0xwhale", "0xnew"})
+    assert session.execute.call_args.args[1] == {"wallets": ["0xnew"]}